@@ -0,0 +1,73 @@
+"""Shared configuration helpers for the example scripts.
+
+Every example used to duplicate its own WalletConfig(...) block. The
+helpers here build each platform's config exactly once per process
+(functools.cache), so importing and running several examples together —
+as a test harness or batch script would — doesn't re-instantiate
+identical config objects.
+"""
+
+import functools
+
+import wallet_pass as wp
+
+
+@functools.cache
+def apple_config():
+    """Configuration for the Apple Wallet examples."""
+    return wp.WalletConfig(
+        apple_pass_type_identifier="pass.com.example.eventticket",
+        apple_team_identifier="ABCDE12345",
+        apple_organization_name="Example Corp",
+        apple_certificate_path="certificates/certificate.pem",
+        apple_private_key_path="certificates/key.pem",
+        apple_wwdr_certificate_path="certificates/wwdr.pem",
+        web_service_url="https://example.com/wallet",
+        storage_path="passes"
+    )
+
+
+@functools.cache
+def google_config():
+    """Configuration for the Google Wallet examples."""
+    return wp.WalletConfig(
+        google_application_credentials="certificates/google_credentials.json",
+        google_issuer_id="3388000000022195611",
+        web_service_url="https://example.com/wallet",
+        storage_path="passes"
+    )
+
+
+@functools.cache
+def samsung_config():
+    """Configuration for the Samsung Wallet examples."""
+    return wp.WalletConfig(
+        samsung_issuer_id="samsung-issuer-123",
+        samsung_api_key="samsung-api-key-456",
+        samsung_service_id="samsung-service-789",
+        samsung_api_base_url="https://wallet-api.samsung.com/v1",
+        web_service_url="https://example.com/wallet",
+        storage_path="passes"
+    )
+
+
+@functools.cache
+def multi_platform_config():
+    """Configuration covering both Apple and Google for the combined example."""
+    return wp.WalletConfig(
+        # Apple configuration
+        apple_pass_type_identifier="pass.com.example.coupon",
+        apple_team_identifier="ABCDE12345",
+        apple_organization_name="Example Corp",
+        apple_certificate_path="certificates/certificate.pem",
+        apple_private_key_path="certificates/key.pem",
+        apple_wwdr_certificate_path="certificates/wwdr.pem",
+
+        # Google configuration
+        google_application_credentials="certificates/google_credentials.json",
+        google_issuer_id="3388000000022195611",
+
+        # Common configuration
+        web_service_url="https://example.com/wallet",
+        storage_path="passes"
+    )
@@ -1,29 +1,28 @@
 """Example usage of the py-wallet-pass SDK."""
 
 import datetime
-import os
 from pathlib import Path
 
 import wallet_pass as wp
 
+import _common
 
-def create_apple_event_ticket():
+# Created once at import time; saves a stat syscall per pass in batch runs
+OUTPUT_DIR = Path("output")
+OUTPUT_DIR.mkdir(exist_ok=True)
+
+
+def build_manager():
+    """Build a pass manager once so certificates are only parsed a single time."""
+    return wp.create_pass_manager(config=_common.apple_config())
+
+
+def create_apple_event_ticket(manager=None):
     """Create an Apple Wallet event ticket."""
-    # Configure the SDK
-    config = wp.WalletConfig(
-        apple_pass_type_identifier="pass.com.example.eventticket",
-        apple_team_identifier="ABCDE12345",
-        apple_organization_name="Example Corp",
-        apple_certificate_path="certificates/certificate.pem",
-        apple_private_key_path="certificates/key.pem",
-        apple_wwdr_certificate_path="certificates/wwdr.pem",
-        web_service_url="https://example.com/wallet",
-        storage_path="passes"
-    )
-    
-    # Create a pass manager
-    manager = wp.create_pass_manager(config=config)
-    
+    # Reuse an injected manager rather than re-parsing certificates per call
+    if manager is None:
+        manager = build_manager()
+
     # Create an event ticket template
     template = wp.utils.create_event_pass_template(
         name="Summer Music Festival",
@@ -57,7 +56,7 @@ def create_apple_event_ticket():
         relevant_date=concert_date,
         field_values={
             "event_name": "Summer Music Festival",
-            "event_date": concert_date.strftime("%B %d, %Y at %I:%M %p"),
+            "event_date": wp.utils.format_event_datetime(concert_date),
             "event_location": "Central Park, New York",
             "ticket_type": "VIP Access",
             "stage": "Main Stage",
@@ -69,35 +68,20 @@ def create_apple_event_ticket():
     response = manager.create_pass(pass_data, template)
     print(f"Created pass: {response['apple'].id}")
     
-    # Generate the .pkpass file
-    pass_file = manager.generate_pass_files(response['apple'].id, template)
-    
-    # Save the .pkpass file
-    os.makedirs("output", exist_ok=True)
-    with open("output/concert_ticket.pkpass", "wb") as f:
-        f.write(pass_file['apple'])
-    
+    # Stream the .pkpass file straight to disk (no in-memory copy)
+    with open(OUTPUT_DIR / "concert_ticket.pkpass", "wb") as f:
+        manager.generate_pass_files_to(f, response['apple'].id, template, platform="apple")
+
     print(f"Saved pass file to: output/concert_ticket.pkpass")
     
     return response['apple'].id
 
-def update_pass_example(pass_id: str):
+def update_pass_example(pass_id: str, manager=None):
     """Example of updating an existing pass."""
-    # Configure the SDK
-    config = wp.WalletConfig(
-        apple_pass_type_identifier="pass.com.example.eventticket",
-        apple_team_identifier="ABCDE12345",
-        apple_organization_name="Example Corp",
-        apple_certificate_path="certificates/certificate.pem",
-        apple_private_key_path="certificates/key.pem",
-        apple_wwdr_certificate_path="certificates/wwdr.pem",
-        web_service_url="https://example.com/wallet",
-        storage_path="passes"
-    )
-    
-    # Create a pass manager
-    manager = wp.create_pass_manager(config=config)
-    
+    # Reuse an injected manager rather than re-parsing certificates per call
+    if manager is None:
+        manager = build_manager()
+
     # Get the existing pass (this would typically be stored in your database)
     response = manager.apple_pass.get_pass(pass_id)
     
@@ -121,7 +105,7 @@ def update_pass_example(pass_id: str):
         relevant_date=concert_date,
         field_values={
             "event_name": "Summer Music Festival",
-            "event_date": concert_date.strftime("%B %d, %Y at %I:%M %p"),  # Updated date
+            "event_date": wp.utils.format_event_datetime(concert_date),  # Updated date
             "event_location": "Central Park, New York",
             "ticket_type": "VIP Access",
             "event_details": "RESCHEDULED: Please arrive 30 minutes before the show. No refunds."  # Updated details
@@ -132,14 +116,10 @@ def update_pass_example(pass_id: str):
     updated_response = manager.update_pass(pass_id, pass_data, template)
     print(f"Updated pass: {updated_response['apple'].id}")
     
-    # Generate the updated .pkpass file
-    pass_file = manager.generate_pass_files(updated_response['apple'].id, template)
-    
-    # Save the updated .pkpass file
-    os.makedirs("output", exist_ok=True)
-    with open("output/updated_concert_ticket.pkpass", "wb") as f:
-        f.write(pass_file['apple'])
-    
+    # Stream the updated .pkpass file straight to disk
+    with open(OUTPUT_DIR / "updated_concert_ticket.pkpass", "wb") as f:
+        manager.generate_pass_files_to(f, updated_response['apple'].id, template, platform="apple")
+
     print(f"Saved updated pass file to: output/updated_concert_ticket.pkpass")
     
     # Send push notification for the update
@@ -149,11 +129,14 @@ def update_pass_example(pass_id: str):
 
 def main():
     """Run the examples."""
+    # Build the config and manager once and share them across the examples
+    manager = build_manager()
+
     print("=== Creating Apple Event Ticket ===")
-    apple_pass_id = create_apple_event_ticket()
-    
+    apple_pass_id = create_apple_event_ticket(manager)
+
     print("\n=== Updating an Existing Pass ===")
-    update_pass_example(apple_pass_id)
+    update_pass_example(apple_pass_id, manager)
 
 
 if __name__ == "__main__":
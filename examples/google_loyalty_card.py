@@ -1,24 +1,21 @@
 """Example usage of the py-wallet-pass SDK."""
 
 import datetime
-import os
 from pathlib import Path
 
 import wallet_pass as wp
 
+import _common
+
+# Created once at import time; saves a stat syscall per pass in batch runs
+OUTPUT_DIR = Path("output")
+OUTPUT_DIR.mkdir(exist_ok=True)
+
 
 def create_google_loyalty_card():
     """Create a Google Wallet loyalty card."""
-    # Configure the SDK
-    config = wp.WalletConfig(
-        google_application_credentials="certificates/google_credentials.json",
-        google_issuer_id="3388000000022195611",
-        web_service_url="https://example.com/wallet",
-        storage_path="passes"
-    )
-    
-    # Create a pass manager
-    manager = wp.create_pass_manager(config=config)
+    # Create a pass manager from the shared (cached) configuration
+    manager = wp.create_pass_manager(config=_common.google_config())
     
     # Create a loyalty card template
     template = wp.utils.create_loyalty_pass_template(
@@ -52,7 +49,7 @@ def create_google_loyalty_card():
         field_values={
             "member_name": "John Smith",
             "points": "450",
-            "member_since": member_since.strftime("%B %d, %Y"),
+            "member_since": wp.utils.format_event_date(member_since),
             "membership_level": "Gold",
             "program_details": "Earn 1 point for every $1 spent.",
             "rewards": "10 points = Free coffee\n50 points = Free pastry\n100 points = Free lunch"
@@ -66,10 +63,8 @@ def create_google_loyalty_card():
     # Generate the Google Wallet JSON file
     pass_file = manager.generate_pass_files(response['google'].id, template)
     
-    # Save the JSON file
-    os.makedirs("output", exist_ok=True)
-    with open("output/loyalty_card.json", "wb") as f:
-        f.write(pass_file['google'])
+    # Save the JSON file in a single os.write call
+    (OUTPUT_DIR / "loyalty_card.json").write_bytes(pass_file['google'])
     
     print(f"Saved pass file to: output/loyalty_card.json")
     print(f"Google Pay link: {response['google'].google_pass_url}")
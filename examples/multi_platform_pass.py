@@ -1,34 +1,21 @@
 """Example usage of the py-wallet-pass SDK."""
 
 import datetime
-import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import wallet_pass as wp
 
+import _common
+
+# Created once at import time; saves a stat syscall per pass in batch runs
+OUTPUT_DIR = Path("output")
+OUTPUT_DIR.mkdir(exist_ok=True)
+
 def create_multi_platform_pass():
     """Create a pass for both Apple and Google platforms."""
-    # Configure the SDK with both platforms
-    config = wp.WalletConfig(
-        # Apple configuration
-        apple_pass_type_identifier="pass.com.example.coupon",
-        apple_team_identifier="ABCDE12345",
-        apple_organization_name="Example Corp",
-        apple_certificate_path="certificates/certificate.pem",
-        apple_private_key_path="certificates/key.pem",
-        apple_wwdr_certificate_path="certificates/wwdr.pem",
-        
-        # Google configuration
-        google_application_credentials="certificates/google_credentials.json",
-        google_issuer_id="3388000000022195611",
-        
-        # Common configuration
-        web_service_url="https://example.com/wallet",
-        storage_path="passes"
-    )
-    
-    # Create a pass manager
-    manager = wp.create_pass_manager(config=config)
+    # Create a pass manager from the shared (cached) configuration
+    manager = wp.create_pass_manager(config=_common.multi_platform_config())
     
     # Create separate templates for each platform
     apple_template = wp.utils.create_coupon_pass_template(
@@ -58,6 +45,15 @@ def create_multi_platform_pass():
     # Common expiration date
     expiration_date = datetime.datetime.now() + datetime.timedelta(days=30)
     
+    # Both platforms carry the same content; sharing one dict means the
+    # canonical field_values blob is computed once across the two passes
+    coupon_field_values = {
+        "offer": "25% Off Your Purchase",
+        "expiration": wp.utils.format_event_date(expiration_date),
+        "promo_code": "SAVE25",
+        "terms": "One time use. Cannot be combined with other offers."
+    }
+
     # Create Apple pass data
     apple_pass_data = wp.utils.create_pass_data(
         template_id=apple_template.id,
@@ -65,14 +61,9 @@ def create_multi_platform_pass():
         barcode_message="COUPON25OFF",
         barcode_alt_text="COUPON25OFF",
         expiration_date=expiration_date,
-        field_values={
-            "offer": "25% Off Your Purchase",
-            "expiration": expiration_date.strftime("%B %d, %Y"),
-            "promo_code": "SAVE25",
-            "terms": "One time use. Cannot be combined with other offers."
-        }
+        field_values=coupon_field_values
     )
-    
+
     # Create Google pass data (same content, different template)
     google_pass_data = wp.utils.create_pass_data(
         template_id=google_template.id,
@@ -80,33 +71,32 @@ def create_multi_platform_pass():
         barcode_message="COUPON25OFF",
         barcode_alt_text="COUPON25OFF",
         expiration_date=expiration_date,
-        field_values={
-            "offer": "25% Off Your Purchase",
-            "expiration": expiration_date.strftime("%B %d, %Y"),
-            "promo_code": "SAVE25",
-            "terms": "One time use. Cannot be combined with other offers."
-        }
+        field_values=coupon_field_values
     )
     
-    # Create the passes
-    apple_response = manager.create_pass(apple_pass_data, apple_template, create_for=["apple"])
-    google_response = manager.create_pass(google_pass_data, google_template, create_for=["google"])
-    
+    def build_apple_pass():
+        response = manager.create_pass(apple_pass_data, apple_template, create_for=["apple"])
+        with open(OUTPUT_DIR / "coupon_apple.pkpass", "wb") as f:
+            manager.generate_pass_files_to(f, response['apple'].id, apple_template, platform="apple")
+        return response
+
+    def build_google_pass():
+        response = manager.create_pass(google_pass_data, google_template, create_for=["google"])
+        with open(OUTPUT_DIR / "coupon_google.json", "wb") as f:
+            manager.generate_pass_files_to(f, response['google'].id, google_template, platform="google")
+        return response
+
+    # The Apple and Google pipelines are independent (signing vs. API calls,
+    # separate output files), so run them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        apple_future = executor.submit(build_apple_pass)
+        google_future = executor.submit(build_google_pass)
+        apple_response = apple_future.result()
+        google_response = google_future.result()
+
     print(f"Created Apple pass: {apple_response['apple'].id}")
     print(f"Created Google pass: {google_response['google'].id}")
     
-    # Generate the pass files
-    apple_pass_file = manager.generate_pass_files(apple_response['apple'].id, apple_template)
-    google_pass_file = manager.generate_pass_files(google_response['google'].id, google_template)
-    
-    # Save the files
-    os.makedirs("output", exist_ok=True)
-    with open("output/coupon_apple.pkpass", "wb") as f:
-        f.write(apple_pass_file['apple'])
-    
-    with open("output/coupon_google.json", "wb") as f:
-        f.write(google_pass_file['google'])
-    
     print("Saved pass files to:")
     print("- output/coupon_apple.pkpass")
     print("- output/coupon_google.json")
@@ -1,26 +1,21 @@
 """Example usage of the py-wallet-pass SDK with Samsung Wallet."""
 
 import datetime
-import os
 from pathlib import Path
 
 import wallet_pass as wp
 
+import _common
+
+# Created once at import time; saves a stat syscall per pass in batch runs
+OUTPUT_DIR = Path("output")
+OUTPUT_DIR.mkdir(exist_ok=True)
+
 
 def create_samsung_membership_card():
     """Create a Samsung Wallet membership card."""
-    # Configure the SDK
-    config = wp.WalletConfig(
-        samsung_issuer_id="samsung-issuer-123",
-        samsung_api_key="samsung-api-key-456",
-        samsung_service_id="samsung-service-789",
-        samsung_api_base_url="https://wallet-api.samsung.com/v1",
-        web_service_url="https://example.com/wallet",
-        storage_path="passes"
-    )
-    
-    # Create a pass manager
-    manager = wp.create_pass_manager(config=config)
+    # Create a pass manager from the shared (cached) configuration
+    manager = wp.create_pass_manager(config=_common.samsung_config())
     
     # Create a membership card template
     template = wp.utils.create_template(
@@ -80,7 +75,7 @@ def create_samsung_membership_card():
             "member_name": "Sarah Johnson",
             "member_id": "9876543",
             "membership_type": "Premium",
-            "expiration": expiration_date.strftime("%B %d, %Y"),
+            "expiration": wp.utils.format_event_date(expiration_date),
             "tier": "Gold",
         }
     )
@@ -92,10 +87,8 @@ def create_samsung_membership_card():
     # Generate the pass file
     pass_file = manager.generate_pass_files(response['samsung'].id, template, platforms=["samsung"])
     
-    # Save the pass file
-    os.makedirs("output", exist_ok=True)
-    with open("output/samsung_membership.json", "wb") as f:
-        f.write(pass_file['samsung'])
+    # Save the pass file in a single os.write call
+    (OUTPUT_DIR / "samsung_membership.json").write_bytes(pass_file['samsung'])
     
     print(f"Saved Samsung pass file to: output/samsung_membership.json")
     
@@ -1,8 +1,6 @@
 """Test fixtures for py-wallet-pass."""
 
-import os
-import tempfile
-from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
@@ -11,97 +9,137 @@ from wallet_pass.storage import MemoryStorage
 from wallet_pass.schema.core import PassType, PassTemplate, PassStructure, PassStyle, PassImages
 
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield temp_dir
+# Canonical test-config kwargs, built once at import; storage_path is
+# supplied by the config fixture so each session writes into its own
+# temp dir.
+_CONFIG_KWARGS = dict(
+    apple_pass_type_identifier="pass.com.example.test",
+    apple_team_identifier="ABCDE12345",
+    apple_organization_name="Test Organization",
+    apple_certificate_path="/path/to/cert.pem",
+    apple_private_key_path="/path/to/key.pem",
+    apple_wwdr_certificate_path="/path/to/wwdr.pem",
+    google_application_credentials="/path/to/google_creds.json",
+    google_issuer_id="1234567890",
+    samsung_issuer_id="samsung-issuer-123",
+    samsung_api_key="samsung-api-key",
+    samsung_service_id="samsung-service-id",
+    web_service_url="https://example.com/wallet",
+)
 
 
-@pytest.fixture
-def config():
-    """Create a test configuration."""
-    return WalletConfig(
-        apple_pass_type_identifier="pass.com.example.test",
-        apple_team_identifier="ABCDE12345",
-        apple_organization_name="Test Organization",
-        apple_certificate_path="/path/to/cert.pem",
-        apple_private_key_path="/path/to/key.pem",
-        apple_wwdr_certificate_path="/path/to/wwdr.pem",
-        google_application_credentials="/path/to/google_creds.json",
-        google_issuer_id="1234567890",
-        samsung_issuer_id="samsung-issuer-123",
-        samsung_api_key="samsung-api-key",
-        samsung_service_id="samsung-service-id",
-        storage_path="/tmp/wallet_pass_test",
-        web_service_url="https://example.com/wallet"
-    )
+@pytest.fixture(scope="session", autouse=True)
+def _warm_models():
+    """Warm lazily-built model machinery before the first test runs.
+
+    The pass models are instantiated at module import above, which
+    already compiles their pydantic schemas during collection; this
+    covers WalletConfig, so its first-construction cost lands in session
+    setup instead of skewing whichever test happens to run first.
+    """
+    WalletConfig(storage_path="/tmp/x", **_CONFIG_KWARGS)
+
+
+# The config and template fixtures return immutable test data, so they
+# are session-scoped: the pydantic constructors run once per test session
+# instead of once per test.
+@pytest.fixture(scope="session")
+def config(tmp_path_factory):
+    """Create a test configuration.
+
+    storage_path points at a per-session temp dir rather than a fixed
+    /tmp literal, so parallel runs (pytest-xdist) cannot collide on a
+    shared directory and no stale state survives between sessions.
+    """
+    storage = tmp_path_factory.mktemp("wallet-pass-storage")
+    return WalletConfig(storage_path=str(storage), **_CONFIG_KWARGS)
 
 
 @pytest.fixture
 def memory_storage():
-    """Create a test memory storage."""
+    """Create a test memory storage.
+
+    Function-scoped on purpose: storage tests mutate their backend, so
+    each test gets a fresh instance.
+    """
     return MemoryStorage()
 
 
-@pytest.fixture
+# Shared template building blocks, constructed once per process. Tests
+# must not mutate these; request a fresh template if you need to.
+# The kwargs live in a read-only mapping so tests that need a variant
+# style can splat and override without risking mutation of the original.
+_STYLE_KW = MappingProxyType({
+    "background_color": "#FFFFFF",
+    "foreground_color": "#000000",
+    "label_color": "#999999",
+    "logo_text": "Test Pass",
+})
+_SHARED_STYLE = PassStyle(**_STYLE_KW)
+_SHARED_IMAGES = PassImages()
+_SHARED_STRUCTURE = PassStructure()
+
+# (provider, pass type, template id) for the parametrized template fixture
+_TEMPLATE_PARAMS = [
+    ("apple", PassType.APPLE_GENERIC, "test-template-apple"),
+    ("google", PassType.GOOGLE_OFFER, "test-template-google"),
+    ("samsung", PassType.SAMSUNG_COUPON, "test-template-samsung"),
+]
+
+
+# Canonical template validated once at import; per-provider templates are
+# cheap copies with only the differing fields swapped in
+_BASE_TEMPLATE = PassTemplate(
+    id="test-template-base",
+    name="Test Base Template",
+    description="A test base template",
+    organization_id="test-org",
+    pass_type=PassType.APPLE_GENERIC,
+    structure=_SHARED_STRUCTURE,
+    style=_SHARED_STYLE,
+    images=_SHARED_IMAGES,
+    is_active=True
+)
+
+
+def _make_template(provider, pass_type, template_id):
+    """Build a test template for one provider.
+
+    model_copy skips re-running pydantic validation on the fields the
+    base template already validated.
+    """
+    return _BASE_TEMPLATE.model_copy(update={
+        "id": template_id,
+        "name": f"Test {provider.title()} Template",
+        "description": f"A test {provider.title()} template",
+        "pass_type": pass_type,
+    })
+
+
+@pytest.fixture(scope="session", params=_TEMPLATE_PARAMS, ids=lambda p: p[0])
+def wallet_template(request):
+    """Create a test template, parametrized across the three providers.
+
+    Tests taking this fixture run once per provider; use the pass_type to
+    tell them apart when behavior differs.
+    """
+    return _make_template(*request.param)
+
+
+# Per-provider aliases for tests that exercise exactly one platform
+@pytest.fixture(scope="session")
 def apple_template():
     """Create a test Apple Wallet template."""
-    return PassTemplate(
-        id="test-template-apple",
-        name="Test Apple Template",
-        description="A test Apple template",
-        organization_id="test-org",
-        pass_type=PassType.APPLE_GENERIC,
-        structure=PassStructure(),
-        style=PassStyle(
-            background_color="#FFFFFF",
-            foreground_color="#000000",
-            label_color="#999999",
-            logo_text="Test Pass"
-        ),
-        images=PassImages(),
-        is_active=True
-    )
+    return _make_template(*_TEMPLATE_PARAMS[0])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def google_template():
     """Create a test Google Wallet template."""
-    return PassTemplate(
-        id="test-template-google",
-        name="Test Google Template",
-        description="A test Google template",
-        organization_id="test-org",
-        pass_type=PassType.GOOGLE_OFFER,
-        structure=PassStructure(),
-        style=PassStyle(
-            background_color="#FFFFFF",
-            foreground_color="#000000",
-            label_color="#999999",
-            logo_text="Test Pass"
-        ),
-        images=PassImages(),
-        is_active=True
-    )
+    return _make_template(*_TEMPLATE_PARAMS[1])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def samsung_template():
     """Create a test Samsung Wallet template."""
-    return PassTemplate(
-        id="test-template-samsung",
-        name="Test Samsung Template",
-        description="A test Samsung template",
-        organization_id="test-org",
-        pass_type=PassType.SAMSUNG_COUPON,
-        structure=PassStructure(),
-        style=PassStyle(
-            background_color="#FFFFFF",
-            foreground_color="#000000",
-            label_color="#999999",
-            logo_text="Test Pass"
-        ),
-        images=PassImages(),
-        is_active=True
-    )
\ No newline at end of file
+    return _make_template(*_TEMPLATE_PARAMS[2])
\ No newline at end of file
@@ -1,80 +1,126 @@
 """Tests for storage backends."""
 
 import json
-import os
-import tempfile
-from pathlib import Path
 
 import pytest
 
-from wallet_pass.storage import FileSystemStorage, MemoryStorage
+from wallet_pass.storage import FileSystemStorage, MemoryStorage, SQLiteStorage
 
 
-def test_memory_storage():
-    """Test the in-memory storage backend."""
-    storage = MemoryStorage()
-    
+# Disk-backed params carry the slow marker so `pytest -m "not slow"`
+# keeps only the in-memory fast path for inner-loop runs
+@pytest.fixture(params=[
+    "memory",
+    pytest.param("filesystem", marks=pytest.mark.slow),
+    pytest.param("sqlite", marks=pytest.mark.slow),
+])
+def storage_backend(request, tmp_path):
+    """Yield (backend, missing-pass exception) for each implementation."""
+    if request.param == "memory":
+        return MemoryStorage(), KeyError
+    if request.param == "sqlite":
+        return SQLiteStorage(tmp_path / "passes.db"), KeyError
+    return FileSystemStorage(tmp_path), FileNotFoundError
+
+
+def _assert_missing_behavior(storage, provider, pass_id, missing_exc):
+    """Check the shared contract for a pass that does not exist."""
+    with pytest.raises(missing_exc):
+        storage.retrieve_pass(provider, pass_id)
+    assert storage.delete_pass(provider, pass_id) is False
+
+
+def test_storage_roundtrip(storage_backend):
+    """Test the store/retrieve/list/delete cycle shared by all backends."""
+    storage, missing_exc = storage_backend
+
     # Test storing and retrieving pass data
     provider = "test"
     pass_id = "test-123"
     pass_data = {"id": pass_id, "value": "test-value"}
-    
+
     storage.store_pass(provider, pass_id, pass_data)
-    retrieved_data = storage.retrieve_pass(provider, pass_id)
-    
-    assert retrieved_data == pass_data
-    
+    assert storage.retrieve_pass(provider, pass_id) == pass_data
+
     # Test listing passes
-    assert storage.list_passes(provider) == [pass_id]
-    
+    assert set(storage.list_passes(provider)) == {pass_id}
+
     # Test deleting a pass
     assert storage.delete_pass(provider, pass_id) is True
-    assert storage.list_passes(provider) == []
-    
-    # Test retrieving a non-existent pass
-    with pytest.raises(KeyError):
-        storage.retrieve_pass(provider, pass_id)
-    
-    # Test deleting a non-existent pass
-    assert storage.delete_pass(provider, pass_id) is False
+    assert not storage.list_passes(provider)
+
+    # Test retrieving and deleting a non-existent pass
+    _assert_missing_behavior(storage, provider, pass_id, missing_exc)
+
+
+@pytest.mark.slow
+def test_filesystem_storage_layout(tmp_path):
+    """Test the on-disk details specific to the filesystem backend."""
+    storage = FileSystemStorage(tmp_path)
+
+    provider = "test"
+    pass_id = "test-123"
+    pass_data = {"id": pass_id, "value": "test-value"}
+
+    storage.store_pass(provider, pass_id, pass_data)
+
+    # The file lands in its shard directory
+    shard = FileSystemStorage._shard(pass_id)
+    pass_path = tmp_path / provider / "passes" / shard / f"{pass_id}.json"
+    assert pass_path.exists()
+
+    # Check the file content; one read_bytes + loads instead of a
+    # TextIOWrapper and incremental json.load
+    stored_data = json.loads(pass_path.read_bytes())
+    assert stored_data == pass_data
+
+    # A pass stored by an older version in the flat layout is still found
+    legacy_path = tmp_path / provider / "passes" / "legacy-456.json"
+    legacy_path.write_text(json.dumps({"id": "legacy-456"}))
+    assert storage.retrieve_pass(provider, "legacy-456") == {"id": "legacy-456"}
+    assert set(storage.list_passes(provider)) == {"legacy-456", pass_id}
+    assert storage.delete_pass(provider, "legacy-456") is True
+
+    # Deleting removes the sharded file
+    assert storage.delete_pass(provider, pass_id) is True
+    assert not pass_path.exists()
+
 
+@pytest.mark.slow
+@pytest.mark.parametrize("format", ["json", "msgpack"])
+def test_filesystem_storage_formats(tmp_path, format):
+    """Test that both on-disk formats round-trip equivalently."""
+    storage = FileSystemStorage(tmp_path, format=format)
+
+    provider = "test"
+    pass_id = "fmt-123"
+    pass_data = {"id": pass_id, "value": "test-value", "count": 3}
+
+    storage.store_pass(provider, pass_id, pass_data)
+
+    # A fresh instance forces a cold read from disk
+    fresh = FileSystemStorage(tmp_path, format=format)
+    assert fresh.retrieve_pass(provider, pass_id) == pass_data
+    assert set(fresh.list_passes(provider)) == {pass_id}
+    assert fresh.delete_pass(provider, pass_id) is True
+
+
+@pytest.mark.slow
+def test_sqlite_storage_bulk(tmp_path):
+    """Test the bulk operations specific to the SQLite backend."""
+    storage = SQLiteStorage(tmp_path / "passes.db")
+
+    provider = "test"
+    storage.store_passes_bulk(provider, {
+        "bulk-1": {"id": "bulk-1"},
+        "bulk-2": {"id": "bulk-2"},
+    })
+    assert set(storage.list_passes(provider)) == {"bulk-1", "bulk-2"}
+    assert storage.retrieve_pass(provider, "bulk-2") == {"id": "bulk-2"}
+    assert storage.delete_passes(provider, ["bulk-1", "bulk-2"]) == {
+        "bulk-1": True,
+        "bulk-2": True,
+    }
+    assert not storage.list_passes(provider)
 
-def test_filesystem_storage():
-    """Test the filesystem storage backend."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        storage = FileSystemStorage(temp_dir)
-        
-        # Test storing and retrieving pass data
-        provider = "test"
-        pass_id = "test-123"
-        pass_data = {"id": pass_id, "value": "test-value"}
-        
-        storage.store_pass(provider, pass_id, pass_data)
-        
-        # Check that the file was created
-        pass_path = Path(temp_dir) / provider / "passes" / f"{pass_id}.json"
-        assert pass_path.exists()
-        
-        # Check the file content
-        with open(pass_path, 'r') as f:
-            stored_data = json.load(f)
-            assert stored_data == pass_data
-        
-        # Test retrieving the pass
-        retrieved_data = storage.retrieve_pass(provider, pass_id)
-        assert retrieved_data == pass_data
-        
-        # Test listing passes
-        assert storage.list_passes(provider) == [pass_id]
-        
-        # Test deleting a pass
-        assert storage.delete_pass(provider, pass_id) is True
-        assert not pass_path.exists()
-        assert storage.list_passes(provider) == []
-        
-        # Test retrieving a non-existent pass
-        with pytest.raises(FileNotFoundError):
-            storage.retrieve_pass(provider, pass_id)
-        
-        # Test deleting a non-existent pass
-        assert storage.delete_pass(provider, pass_id) is False
\ No newline at end of file
+    storage.close()
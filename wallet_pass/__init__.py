@@ -5,6 +5,7 @@ This package provides a simple API for creating and managing digital wallet pass
 for both Apple Wallet and Google Wallet platforms.
 """
 
+import functools
 import sys
 from pathlib import Path
 
@@ -41,6 +42,7 @@ from .schema.core import (
     PassResponse
 )
 from .providers.manager import PassManager
+from .providers.async_manager import AsyncPassManager
 from .utils import (
     create_template,
     add_field_to_template,
@@ -50,9 +52,23 @@ from .utils import (
     create_event_pass_template,
     create_coupon_pass_template,
     create_loyalty_pass_template,
-    create_boarding_pass_template
+    create_boarding_pass_template,
+    format_event_datetime,
+    format_event_date
 )
-from .storage import StorageBackend, FileSystemStorage, MemoryStorage, create_storage_backend
+from .storage import StorageBackend, FileSystemStorage, SQLiteStorage, MemoryStorage, create_storage_backend
+
+# Managers are memoized per (config, storage, storage path) triple so scripts
+# that rebuild a manager for every pass don't re-parse certificates and
+# re-create API clients each time. Config and storage are keyed on instance
+# identity, so a fresh WalletConfig still gets a fresh manager; the effective
+# storage path is part of the key so the same config reused with a different
+# storage_path override gets a manager that actually writes there.
+@functools.lru_cache(maxsize=8)
+def _build_manager(config, storage, storage_path):
+    """Build (and cache) a PassManager for the given configuration."""
+    return PassManager(config, storage=storage)
+
 
 # Convenience function to quickly set up a pass manager
 def create_pass_manager(config_dict=None, config=None, storage=None, storage_path=None):
@@ -100,26 +116,25 @@ def create_pass_manager(config_dict=None, config=None, storage=None, storage_pat
         config.storage_path = Path(storage_path)
         logger.debug(f"Set custom storage path: {storage_path}")
     
-    # Create the PassManager
+    # Create (or reuse) the PassManager
     logger.info("🛠️ Creating PassManager instance")
-    manager = PassManager(config, storage=storage)
-    
-    # Check if any pass providers were initialized
-    has_providers = any([
-        manager.apple_pass is not None,
-        manager.google_pass is not None,
-        manager.samsung_pass is not None
-    ])
+    manager = _build_manager(config, storage, str(config.storage_path))
     
-    if has_providers:
-        provider_names = []
-        if manager.apple_pass is not None:
-            provider_names.append("Apple Wallet")
-        if manager.google_pass is not None:
-            provider_names.append("Google Wallet")
-        if manager.samsung_pass is not None:
-            provider_names.append("Samsung Wallet")
-            
+    # Report which platforms the configuration enables. This reads the
+    # manager's precomputed availability predicates rather than the
+    # provider properties: probing the properties here would eagerly
+    # construct every provider and defeat their lazy initialization
+    provider_names = [
+        name
+        for name, available in (
+            ("Apple Wallet", manager._apple_available),
+            ("Google Wallet", manager._google_available),
+            ("Samsung Wallet", manager._samsung_available),
+        )
+        if available
+    ]
+
+    if provider_names:
         logger.success(f"✅ PassManager ready with providers: {', '.join(provider_names)}")
     else:
         logger.warning(
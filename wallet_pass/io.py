@@ -0,0 +1,39 @@
+"""Batched file-read helpers.
+
+Provider initialization reads several small files back to back (signing
+certificate, private key, WWDR certificate); each serial read waits out
+its own disk or page-cache miss. read_all issues the reads as one batch
+on a short-lived thread pool so the waits overlap, which cuts cold-start
+latency for servers that rebuild providers per tenant.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, Union
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def _read(path: Union[str, Path]) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def read_all(paths: Iterable[Union[str, Path]]) -> Dict[Any, bytes]:
+    """
+    Read several files, overlapping the I/O waits.
+
+    Args:
+        paths: Files to read
+
+    Returns:
+        Dict mapping each given path (as passed) to its contents
+    """
+    paths = list(paths)
+    if len(paths) <= 1:
+        return {path: _read(path) for path in paths}
+
+    with ThreadPoolExecutor(max_workers=min(len(paths), 8)) as executor:
+        return dict(zip(paths, executor.map(_read, paths)))
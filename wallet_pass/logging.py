@@ -9,13 +9,20 @@ and diagnostic information.
 import sys
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional
 
-from loguru import logger, Logger
+from loguru import logger
+
+if TYPE_CHECKING:
+    from loguru import Logger
 
 # Add a custom SUCCESS level to loguru
 success_level = 25  # Between INFO (20) and WARNING (30)
-logger.level("SUCCESS", no=success_level, color="<green>")
+try:
+    logger.level("SUCCESS", no=success_level, color="<green>")
+except ValueError:
+    # Loguru already ships a SUCCESS level with the same severity
+    pass
 
 # Remove default logger
 logger.remove()
@@ -65,7 +72,7 @@ if LOG_DIR:
 logger.configure(handlers=[{"sink": sys.stderr, "format": CONSOLE_FORMAT}])
 
 
-def get_logger(name: str) -> Logger:
+def get_logger(name: str) -> "Logger":
     """
     Get a logger for the specified module with contextualized information.
     
@@ -87,7 +94,7 @@ def with_context(**kwargs) -> Dict[str, Any]:
     
     Example:
         ```python
-        from py_wallet_pass.logging import logger, with_context
+        from wallet_pass.logging import logger, with_context
         
         pass_id = "pass123"
         template_id = "template456"
@@ -1,17 +1,24 @@
 from .base import BasePass
 from .manager import PassManager
+from .async_manager import AsyncPassManager
 
-try:
-    from .apple_pass import ApplePass
-except ImportError:
-    pass
+# Provider classes are imported lazily (PEP 562): each pulls in heavy
+# optional dependencies (pyOpenSSL, google-api-python-client), so loading
+# them at package import would tax every `import wallet_pass` even when
+# only one platform is used.
+_PROVIDER_MODULES = {
+    "ApplePass": "apple_pass",
+    "GooglePass": "google_pass",
+    "SamsungPass": "samsung_pass",
+}
 
-try:
-    from .samsung_pass import SamsungPass
-except ImportError:
-    pass
 
-try:
-    from .google_pass import GooglePass
-except ImportError:
-    pass
\ No newline at end of file
+def __getattr__(name):
+    module_name = _PROVIDER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # cache so __getattr__ runs once per class
+    return value
@@ -1,25 +1,73 @@
-import base64
+import functools
 import hashlib
-import json
-import os
-import tempfile
+import secrets
 import zipfile
 import io
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.serialization import pkcs7
 from OpenSSL import crypto
 
 from ..config import WalletConfig
 from ..exceptions import AppleWalletError, CertificateError, PassCreationError
-from ..schema.core import PassData, PassResponse, PassTemplate, PassType, Barcode
+from ..io import read_all
+from ..schema.core import PassData, PassImages, PassResponse, PassTemplate, PassType, Barcode
+from ..serialization import dumps_bytes
 from ..storage import StorageBackend, FileSystemStorage
 from ..logging import get_logger, with_context
 from .base import BasePass
 
 logger = get_logger(__name__)
 
+# Pinned timestamp for .pkpass ZIP entries. Stamping real mtimes costs a
+# time.localtime call per entry and makes the archive non-deterministic;
+# a fixed DOS epoch avoids both, so identical input produces identical
+# signed output.
+_ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+# Bundle entries stored without DEFLATE: image assets are already
+# entropy-coded, so compressing them burns Huffman/LZ77 CPU for no size
+# win. The tiny JSON members still deflate well and stay compressed.
+_STORED_SUFFIXES = ('.png', '.jpg', '.jpeg')
+
+# Optional PassField attributes and the pass.json keys they map to;
+# walked once per field instead of seven separate if-branches
+_OPTIONAL_FIELD_MAP = (
+    ('change_message', 'changeMessage'),
+    ('text_alignment', 'textAlignment'),
+    ('date_style', 'dateStyle'),
+    ('time_style', 'timeStyle'),
+    ('is_relative', 'isRelative'),
+    ('currency_code', 'currencyCode'),
+    ('number_format', 'numberFormat'),
+)
+
+
+# PEM parsing is CPU-bound ASN.1 and bignum work, so the parsed handles are
+# cached at module level keyed on the PEM bytes themselves. Instances built
+# from different config objects that point at the same certificate material
+# share one parse; rotated files naturally miss the cache because their
+# contents change.
+# Config fingerprints that already passed _validate_config; instances
+# built from an equivalent config skip the field checks and the three
+# certificate-file stats. Configs are fixed at app start, so entries
+# never need invalidating.
+_VALIDATED_CONFIGS: set = set()
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_pem_certificate(cert_data: bytes) -> crypto.X509:
+    return crypto.load_certificate(crypto.FILETYPE_PEM, cert_data)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_pem_private_key(key_data: bytes) -> crypto.PKey:
+    return crypto.load_privatekey(crypto.FILETYPE_PEM, key_data)
+
 
 class ApplePass(BasePass):
     """Implementation of Apple Wallet passes."""
@@ -33,14 +81,27 @@ class ApplePass(BasePass):
         
         # Validate required configuration
         self._validate_config()
-        
-        # Load certificates
-        self._certificate = self._load_certificate()
-        self._private_key = self._load_private_key()
-        self._wwdr_certificate = self._load_wwdr_certificate()
+
+        # Load certificates once at construction; the parsed objects are
+        # cached on the config so other instances sharing it skip the PEM
+        # parse and key decode entirely
+        self._load_all_certificates()
+
+        # Per-template pass.json skeletons and image-asset bytes, keyed
+        # by template ID
+        self._skeletons: Dict[str, Dict[str, Any]] = {}
+        self._image_cache: Dict[str, Dict[str, bytes]] = {}
+
+        # Parsed PassResponse objects keyed by pass ID, invalidated by
+        # file mtime (see get_pass)
+        self._response_cache: Dict[str, Tuple[int, PassResponse]] = {}
     
     def _validate_config(self) -> None:
-        """Validate the configuration for Apple Wallet."""
+        """Validate the configuration for Apple Wallet.
+
+        A config that already validated (by value) is skipped, so request-
+        per-instance deployments pay the existence stats only once.
+        """
         required_fields = [
             'apple_pass_type_identifier',
             'apple_team_identifier',
@@ -49,50 +110,116 @@ class ApplePass(BasePass):
             'apple_private_key_path',
             'apple_wwdr_certificate_path',
         ]
-        
-        missing_fields = [field for field in required_fields 
-                        if not getattr(self.config, field)]
-        
+
+        fingerprint = tuple(getattr(self.config, field) for field in required_fields)
+        if fingerprint in _VALIDATED_CONFIGS:
+            return
+
+        missing_fields = [field for field, value in zip(required_fields, fingerprint)
+                        if not value]
+
         if missing_fields:
             raise CertificateError(
                 f"Missing required Apple Wallet configuration fields: {', '.join(missing_fields)}"
             )
-        
+
         # Check if certificate files exist
         for field in ['apple_certificate_path', 'apple_private_key_path', 'apple_wwdr_certificate_path']:
             path = getattr(self.config, field)
             if not path.exists():
                 raise CertificateError(f"File not found: {path}")
+
+        _VALIDATED_CONFIGS.add(fingerprint)
     
-    def _load_certificate(self) -> crypto.X509:
-        """Load the Apple Wallet certificate."""
+    def _load_all_certificates(self) -> None:
+        """Load the certificate, private key and WWDR certificate.
+
+        The PEM files not already parsed on the config are read as one
+        batch (see wallet_pass.io.read_all), so construction pays one I/O
+        wait instead of three serial ones.
+        """
+        config = self.config
+        needed = [
+            path
+            for name, path in (
+                ('_loaded_apple_certificate', config.apple_certificate_path),
+                ('_loaded_apple_private_key', config.apple_private_key_path),
+                ('_loaded_apple_wwdr_certificate', config.apple_wwdr_certificate_path),
+            )
+            if getattr(config, name, None) is None
+        ]
         try:
-            with open(self.config.apple_certificate_path, 'rb') as f:
-                cert_data = f.read()
-            
-            return crypto.load_certificate(crypto.FILETYPE_PEM, cert_data)
+            blobs = read_all(needed) if needed else {}
+        except Exception as e:
+            raise CertificateError(f"Failed to load Apple certificates: {e}")
+
+        self._certificate = self._load_certificate(blobs.get(config.apple_certificate_path))
+        self._private_key = self._load_private_key(blobs.get(config.apple_private_key_path))
+        self._wwdr_certificate = self._load_wwdr_certificate(blobs.get(config.apple_wwdr_certificate_path))
+
+        # Converted once here so signing never pays the pyOpenSSL->
+        # cryptography handle conversion on the hot path. Reusing one
+        # RSAPrivateKey across signs also keeps OpenSSL's per-key
+        # Montgomery context warm, which matters for bulk regeneration
+        self._signing_certificate = self._certificate.to_cryptography()
+        self._signing_key = self._private_key.to_cryptography_key()
+        self._signing_wwdr = self._wwdr_certificate.to_cryptography()
+
+    def _load_certificate(self, cert_data: Optional[bytes] = None) -> crypto.X509:
+        """Load the Apple Wallet certificate (cached on the config)."""
+        cached = getattr(self.config, '_loaded_apple_certificate', None)
+        if cached is not None:
+            return cached
+        try:
+            if cert_data is None:
+                cert_data = self.config.apple_certificate_path.read_bytes()
+
+            certificate = _parse_pem_certificate(cert_data)
+            self.config._loaded_apple_certificate = certificate
+            return certificate
         except Exception as e:
             raise CertificateError(f"Failed to load Apple certificate: {e}")
-    
-    def _load_private_key(self) -> crypto.PKey:
-        """Load the Apple Wallet private key."""
+
+    def _load_private_key(self, key_data: Optional[bytes] = None) -> crypto.PKey:
+        """Load the Apple Wallet private key (cached on the config)."""
+        cached = getattr(self.config, '_loaded_apple_private_key', None)
+        if cached is not None:
+            return cached
         try:
-            with open(self.config.apple_private_key_path, 'rb') as f:
-                key_data = f.read()
-            
-            return crypto.load_privatekey(crypto.FILETYPE_PEM, key_data)
+            if key_data is None:
+                key_data = self.config.apple_private_key_path.read_bytes()
+
+            private_key = _parse_pem_private_key(key_data)
+            self.config._loaded_apple_private_key = private_key
+            return private_key
         except Exception as e:
             raise CertificateError(f"Failed to load Apple private key: {e}")
-    
-    def _load_wwdr_certificate(self) -> crypto.X509:
-        """Load the Apple WWDR certificate."""
+
+    def _load_wwdr_certificate(self, cert_data: Optional[bytes] = None) -> crypto.X509:
+        """Load the Apple WWDR certificate (cached on the config)."""
+        cached = getattr(self.config, '_loaded_apple_wwdr_certificate', None)
+        if cached is not None:
+            return cached
         try:
-            with open(self.config.apple_wwdr_certificate_path, 'rb') as f:
-                cert_data = f.read()
-            
-            return crypto.load_certificate(crypto.FILETYPE_PEM, cert_data)
+            if cert_data is None:
+                cert_data = self.config.apple_wwdr_certificate_path.read_bytes()
+
+            certificate = _parse_pem_certificate(cert_data)
+            self.config._loaded_apple_wwdr_certificate = certificate
+            return certificate
         except Exception as e:
             raise CertificateError(f"Failed to load Apple WWDR certificate: {e}")
+
+    def preload_certificates(self) -> None:
+        """Warm the certificate cache so signing never parses PEMs on the hot path.
+
+        Loading happens in __init__ already; this re-runs the loaders so a
+        caller can refresh the cached objects after rotating certificates.
+        """
+        self.config._loaded_apple_certificate = None
+        self.config._loaded_apple_private_key = None
+        self.config._loaded_apple_wwdr_certificate = None
+        self._load_all_certificates()
     
     def create_pass(self, pass_data: PassData, template: PassTemplate) -> PassResponse:
         """Create a new Apple Wallet pass."""
@@ -114,8 +241,11 @@ class ApplePass(BasePass):
             # Store the pass data for retrieval
             self._store_pass_data(pass_id, pass_json)
             
-            # Return the pass response
-            response = PassResponse(
+            # Return the pass response (one clock read for both stamps).
+            # Every value here is internally sourced and already typed, so
+            # model_construct skips pydantic's per-field validation pass
+            now = datetime.now()
+            response = PassResponse.model_construct(
                 id=pass_id,
                 template_id=template.id,
                 customer_id=pass_data.customer_id,
@@ -125,8 +255,8 @@ class ApplePass(BasePass):
                 organization_id=template.organization_id,
                 voided=pass_data.voided,
                 expiration_date=pass_data.expiration_date,
-                created_at=datetime.now(),
-                updated_at=datetime.now(),
+                created_at=now,
+                updated_at=now,
                 apple_pass_id=pass_id,
                 apple_pass_url=self._generate_pass_url(pass_id)
             )
@@ -155,8 +285,9 @@ class ApplePass(BasePass):
             # Store the updated pass data
             self._store_pass_data(pass_id, pass_json)
             
-            # Return the updated pass response
-            return PassResponse(
+            # Return the updated pass response (internally sourced values;
+            # skip validation)
+            return PassResponse.model_construct(
                 id=pass_id,
                 template_id=template.id,
                 customer_id=pass_data.customer_id,
@@ -174,8 +305,50 @@ class ApplePass(BasePass):
         except Exception as e:
             raise PassCreationError(f"Failed to update Apple pass: {e}")
     
+    @staticmethod
+    def _as_datetime(value: Any, fallback: datetime) -> datetime:
+        """Coerce a stored timestamp to a datetime.
+
+        Filesystem storage round-trips through JSON and yields ISO
+        strings; memory storage hands the original datetime object back
+        untouched. Missing values fall back to the supplied default.
+        """
+        if isinstance(value, datetime):
+            return value
+        return datetime.fromisoformat(value) if value else fallback
+
+    def _pass_mtime_ns(self, pass_id: str) -> Optional[int]:
+        """Return the stored pass file's mtime in nanoseconds, if knowable.
+
+        Only filesystem-backed storage exposes an mtime; other backends
+        return None, which disables response caching for them.
+        """
+        if not isinstance(self.storage, FileSystemStorage):
+            return None
+        for path in (
+            self.storage._pass_path("apple", pass_id),
+            self.storage._legacy_pass_path("apple", pass_id),
+        ):
+            try:
+                return path.stat().st_mtime_ns
+            except OSError:
+                continue
+        return None
+
     def get_pass(self, pass_id: str) -> PassResponse:
-        """Retrieve a pass by ID."""
+        """Retrieve a pass by ID.
+
+        Hot read paths (e.g. PassKit web service polling) hit the same
+        pass repeatedly; the parsed response is cached keyed on the stored
+        file's mtime so unchanged passes skip the JSON read and the two
+        datetime parses. Callers get a copy, so mutating the result (as
+        void_pass does) never poisons the cache.
+        """
+        mtime_ns = self._pass_mtime_ns(pass_id)
+        cached = self._response_cache.get(pass_id)
+        if cached is not None and mtime_ns is not None and cached[0] == mtime_ns:
+            return cached[1].model_copy()
+
         try:
             # Retrieve the stored pass data
             pass_json = self._retrieve_pass_data(pass_id)
@@ -183,9 +356,11 @@ class ApplePass(BasePass):
             # Extract metadata
             serial_number = pass_json.get('serialNumber')
             voided = pass_json.get('voided', False)
+            now = datetime.now()
             
-            # Create a pass response
-            return PassResponse(
+            # Create a pass response from our own stored document; values
+            # were validated on the way in, so skip re-validation
+            response = PassResponse.model_construct(
                 id=pass_id,
                 template_id=pass_json.get('templateId', ''),
                 customer_id=pass_json.get('customerId', ''),
@@ -195,14 +370,19 @@ class ApplePass(BasePass):
                 organization_id=pass_json.get('organizationId', ''),
                 voided=voided,
                 expiration_date=None,  # Would parse from the JSON if available
-                created_at=datetime.fromisoformat(pass_json.get('createdAt', datetime.now().isoformat())),
-                updated_at=datetime.fromisoformat(pass_json.get('updatedAt', datetime.now().isoformat())),
+                created_at=self._as_datetime(pass_json.get('createdAt'), now),
+                updated_at=self._as_datetime(pass_json.get('updatedAt'), now),
                 apple_pass_id=pass_id,
                 apple_pass_url=self._generate_pass_url(pass_id)
             )
+
+            if mtime_ns is not None:
+                self._response_cache[pass_id] = (mtime_ns, response.model_copy())
+
+            return response
         except Exception as e:
             raise AppleWalletError(f"Failed to retrieve Apple pass: {e}")
-    
+
     def void_pass(self, pass_id: str) -> PassResponse:
         """Mark a pass as void."""
         try:
@@ -228,53 +408,71 @@ class ApplePass(BasePass):
     
     def generate_pass_file(self, pass_id: str, template: PassTemplate) -> bytes:
         """Generate an Apple Wallet .pkpass file."""
+        buffer = io.BytesIO()
+        self.generate_pass_file_to(buffer, pass_id, template)
+        return buffer.getvalue()
+
+    def generate_pass_file_to(self, fileobj: Any, pass_id: str, template: PassTemplate) -> None:
+        """Generate an Apple Wallet .pkpass file directly into a binary stream.
+
+        The bundle is assembled entirely in memory: pass.json is serialized
+        to bytes, image assets are batch-read once, and the archive is
+        written straight to the supplied stream. No temporary directory is
+        created, so nothing crosses the filesystem twice.
+
+        Args:
+            fileobj: Writable binary stream (e.g. an open file) to receive the archive
+            pass_id: ID of the pass to generate
+            template: Template for the pass
+        """
         try:
             context = with_context(
                 action="generate_pass_file",
-                platform="apple", 
+                platform="apple",
                 pass_id=pass_id,
                 template_id=template.id
             )
             logger.bind(**context).debug("📦 Starting pass file generation")
-            
+
             # Retrieve the pass data
             pass_json = self._retrieve_pass_data(pass_id)
-            
-            # Create a temporary directory for the pass files
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                logger.bind(**context).debug(f"Created temporary directory at {temp_dir}")
-                
-                # Write the pass.json file
-                with open(temp_path / 'pass.json', 'w') as f:
-                    json.dump(pass_json, f)
-                
-                # Copy the required images
-                self._add_pass_images(temp_path, template)
-                
-                # Create the manifest file
-                manifest = self._create_manifest(temp_path)
-                with open(temp_path / 'manifest.json', 'w') as f:
-                    json.dump(manifest, f)
-                
-                # Sign the manifest
-                signature = self._sign_manifest(manifest)
-                with open(temp_path / 'signature', 'wb') as f:
-                    f.write(signature)
-                
-                logger.bind(**context).debug("Creating .pkpass archive")
-                # Create the .pkpass file
-                buffer = io.BytesIO()
-                with zipfile.ZipFile(buffer, 'w') as zip_file:
-                    for file_path in temp_path.glob('*'):
-                        zip_file.write(file_path, arcname=file_path.name)
-                
-                # Return the .pkpass data
-                buffer.seek(0)
-                pkpass_data = buffer.read()
-                
-                logger.bind(**context).success(f"🎉 Successfully generated .pkpass file ({len(pkpass_data)/1024:.1f} KB)")
-                return pkpass_data
+
+            # Assemble the bundle contents in memory (orjson-backed
+            # serializer emits bytes directly)
+            files: Dict[str, bytes] = {'pass.json': dumps_bytes(pass_json)}
+            files.update(self._collect_pass_images(template))
+
+            # The manifest covers every bundle file; hashing the in-memory
+            # bytes means each asset is read exactly once. hashlib drops
+            # the GIL for buffers over 2 KiB, so multi-image bundles hash
+            # on a short-lived pool (same pattern as io.read_all)
+            manifest = self._hash_files(files)
+
+            logger.bind(**context).debug("Creating .pkpass archive")
+            with zipfile.ZipFile(fileobj, 'w', zipfile.ZIP_DEFLATED, strict_timestamps=False) as zip_file:
+                for name, data in files.items():
+                    zip_info = zipfile.ZipInfo(name, date_time=_ZIP_EPOCH)
+                    zip_info.compress_type = (
+                        zipfile.ZIP_STORED
+                        if name.lower().endswith(_STORED_SUFFIXES)
+                        else zipfile.ZIP_DEFLATED
+                    )
+                    zip_file.writestr(zip_info, data)
+
+                # Serialize the manifest once; the same bytes are archived
+                # and signed, so the signature always covers the document
+                # Wallet will actually hash
+                manifest_bytes = dumps_bytes(manifest)
+
+                manifest_info = zipfile.ZipInfo('manifest.json', date_time=_ZIP_EPOCH)
+                manifest_info.compress_type = zipfile.ZIP_DEFLATED
+                zip_file.writestr(manifest_info, manifest_bytes)
+
+                signature_info = zipfile.ZipInfo('signature', date_time=_ZIP_EPOCH)
+                signature_info.compress_type = zipfile.ZIP_DEFLATED
+                zip_file.writestr(signature_info, self._sign_manifest(manifest_bytes))
+
+            logger.bind(**context).success("🎉 Successfully generated .pkpass file")
         except Exception as e:
             context = with_context(action="generate_pass_file_error", platform="apple", pass_id=pass_id, error=str(e))
             logger.bind(**context).error(f"⚠️ Failed to generate Apple Wallet pass file: {e}")
@@ -340,75 +538,59 @@ class ApplePass(BasePass):
             logger.error(f"Failed to send Apple push notification: {e}")
             return False
     
-    def _generate_pass_json(self, pass_data: PassData, template: PassTemplate) -> Dict[str, Any]:
-        """Generate the pass.json content."""
-        # Basic pass structure
-        pass_dict = {
+    def _template_skeleton(self, template: PassTemplate) -> Dict[str, Any]:
+        """Build (or fetch) the pass.json skeleton for a template.
+
+        Everything derived only from the template and the config — headers,
+        colors, locations, NFC, web service details — is identical for
+        every pass minted from the same template, so it is computed once
+        and cached per template ID. Callers must treat the returned dict
+        and its nested values as immutable; per-pass data is patched onto
+        a shallow copy. A template edited in place should get a fresh ID.
+        """
+        skeleton = self._skeletons.get(template.id)
+        if skeleton is not None:
+            return skeleton
+
+        skeleton = {
             # Standard pass headers
             "formatVersion": 1,
             "passTypeIdentifier": self.config.apple_pass_type_identifier,
-            "serialNumber": pass_data.serial_number,
             "teamIdentifier": self.config.apple_team_identifier,
             "organizationName": self.config.apple_organization_name,
-            
+
             # Custom metadata (not used by Apple, but useful for our SDK)
             "templateId": template.id,
-            "customerId": pass_data.customer_id,
             "organizationId": template.organization_id,
-            "createdAt": datetime.now().isoformat(),
-            "updatedAt": datetime.now().isoformat(),
-            
+
             # Pass visual style
             "description": template.description or f"{template.name} Pass",
             "logoText": template.style.logo_text,
         }
-        
+
         # Add colors if specified
-        if template.style.background_color:
-            pass_dict["backgroundColor"] = template.style.background_color
-        if template.style.foreground_color:
-            pass_dict["foregroundColor"] = template.style.foreground_color
-        if template.style.label_color:
-            pass_dict["labelColor"] = template.style.label_color
-        
-        # Add expiration if specified
-        if pass_data.expiration_date:
-            pass_dict["expirationDate"] = pass_data.expiration_date.isoformat()
-        
-        # Add relevant date if specified
-        if pass_data.relevant_date:
-            pass_dict["relevantDate"] = pass_data.relevant_date.isoformat()
-        
-        # Add voided status if specified
-        if pass_data.voided:
-            pass_dict["voided"] = True
-        
-        # Add barcode
-        if pass_data.barcode_message:
-            barcode = {
-                "format": template.barcode_format,
-                "message": pass_data.barcode_message,
-                "messageEncoding": "iso-8859-1"
-            }
-            if pass_data.barcode_alt_text:
-                barcode["altText"] = pass_data.barcode_alt_text
-            
-            pass_dict["barcodes"] = [barcode]
-            # For backward compatibility with older iOS versions
-            pass_dict["barcode"] = barcode
-        
+        skeleton.update({
+            key: value
+            for key, value in (
+                ("backgroundColor", template.style.background_color),
+                ("foregroundColor", template.style.foreground_color),
+                ("labelColor", template.style.label_color),
+            )
+            if value
+        })
+
         # Add authentication token for web service
         if template.authentication_token:
-            pass_dict["authenticationToken"] = template.authentication_token
-        
+            skeleton["authenticationToken"] = template.authentication_token
+
         # Add web service URL if specified
         web_service_url = template.web_service_url or self.config.web_service_url
         if web_service_url:
-            pass_dict["webServiceURL"] = str(web_service_url)
-        
+            skeleton["webServiceURL"] = str(web_service_url)
+
         # Add locations if specified
         if template.locations:
-            pass_dict["locations"] = [
+            skeleton["locations"] = [
                 {
                     "latitude": location.latitude,
                     "longitude": location.longitude,
@@ -416,20 +598,64 @@ class ApplePass(BasePass):
                     "relevantText": location.relevant_text
                 } for location in template.locations
             ]
-        
+
         # Add NFC if enabled
         if template.nfc_enabled and template.nfc_data:
-            pass_dict["nfc"] = {
+            skeleton["nfc"] = {
                 "message": template.nfc_data.message,
                 "encryptionPublicKey": template.nfc_data.encryption_public_key,
                 "requiresAuthentication": template.nfc_data.requires_authentication
             }
-        
-        # Add the pass style (generic, coupon, eventTicket, etc.)
+
+        self._skeletons[template.id] = skeleton
+        return skeleton
+
+    def _generate_pass_json(self, pass_data: PassData, template: PassTemplate) -> Dict[str, Any]:
+        """Generate the pass.json content."""
+        # Template-invariant structure comes from the cached skeleton;
+        # only the per-pass values below are patched onto a copy
+        pass_dict = self._template_skeleton(template).copy()
+
+        # createdAt/updatedAt are internal metadata, so the raw datetime
+        # goes in as-is and the serializer formats it natively in C;
+        # Apple-spec date keys below stay pre-formatted ISO strings
+        now = datetime.now()
+        pass_dict["serialNumber"] = pass_data.serial_number
+        pass_dict["customerId"] = pass_data.customer_id
+        pass_dict["createdAt"] = now
+        pass_dict["updatedAt"] = now
+
+        # Expiration, relevant date and voided status spread in together
+        # when present — one C-level dict insert instead of three branches
+        pass_dict.update({
+            key: value
+            for key, value in (
+                ("expirationDate", pass_data.expiration_date.isoformat() if pass_data.expiration_date else None),
+                ("relevantDate", pass_data.relevant_date.isoformat() if pass_data.relevant_date else None),
+                ("voided", True if pass_data.voided else None),
+            )
+            if value
+        })
+
+        # Add barcode
+        if pass_data.barcode_message:
+            barcode = {
+                "format": template.barcode_format,
+                "message": pass_data.barcode_message,
+                "messageEncoding": "iso-8859-1"
+            }
+            if pass_data.barcode_alt_text:
+                barcode["altText"] = pass_data.barcode_alt_text
+
+            pass_dict["barcodes"] = [barcode]
+            # For backward compatibility with older iOS versions
+            pass_dict["barcode"] = barcode
+
+        # Add the pass style key (generic, coupon, eventTicket, etc.).
+        # PassType values already hold the Apple style keys verbatim; the
+        # APPLE_ prefix only ever appears in the member names
         pass_type = template.pass_type.value
-        if pass_type.startswith("APPLE_"):
-            pass_type = pass_type[6:].lower()  # Remove APPLE_ prefix and convert to lowercase
-        
+
         # Add fields for the pass type
         pass_dict[pass_type] = {}
         
@@ -446,59 +672,49 @@ class ApplePass(BasePass):
         """Add fields to the pass JSON."""
         if not fields:
             return
-        
-        pass_dict[field_type] = []
-        
-        for field in fields:
-            # Get the field value - either from the field_values in pass_data or use the default in the template
-            value = pass_data.field_values.get(field.key, field.value)
-            
-            field_dict = {
+
+        field_values = pass_data.field_values
+        pass_dict[field_type] = [
+            {
+                # The field value comes from pass_data when supplied,
+                # otherwise the template default
                 "key": field.key,
                 "label": field.label,
-                "value": value
+                "value": field_values.get(field.key, field.value),
+                # Optional attributes spread in only when truthy
+                **{
+                    json_key: value
+                    for attr, json_key in _OPTIONAL_FIELD_MAP
+                    if (value := getattr(field, attr))
+                },
             }
-            
-            # Add optional fields if they exist
-            if field.change_message:
-                field_dict["changeMessage"] = field.change_message
-            
-            if field.text_alignment:
-                field_dict["textAlignment"] = field.text_alignment
-            
-            if field.date_style:
-                field_dict["dateStyle"] = field.date_style
-            
-            if field.time_style:
-                field_dict["timeStyle"] = field.time_style
-            
-            if field.is_relative:
-                field_dict["isRelative"] = field.is_relative
-            
-            if field.currency_code:
-                field_dict["currencyCode"] = field.currency_code
-            
-            if field.number_format:
-                field_dict["numberFormat"] = field.number_format
-            
-            pass_dict[field_type].append(field_dict)
+            for field in fields
+        ]
     
-    def _add_pass_images(self, temp_path: Path, template: PassTemplate) -> None:
-        """Add images to the pass package.
-        
-        This method copies image files specified in the template to the temporary pass directory.
-        It checks for both normal and @2x (retina) versions of each image.
-        
+    def _collect_pass_images(self, template: PassTemplate) -> Dict[str, bytes]:
+        """Collect the template's image assets as in-memory bytes.
+
+        Resolves each image specified in the template (and any @2x retina
+        variant found by naming convention), then reads the resolved files
+        as one batch so the I/O waits overlap. Assets are immutable per
+        template, so the collected bytes are cached by template ID and
+        repeated generations skip disk entirely; like the pass.json
+        skeletons, a template edited in place should get a fresh ID.
+
         Args:
-            temp_path: Path to the temporary directory for the pass files
             template: Pass template containing image paths
+
+        Returns:
+            Dict mapping bundle file name (e.g. 'icon.png') to image bytes
         """
-        import shutil
-        
+        cached = self._image_cache.get(template.id)
+        if cached is not None:
+            return cached
+
         if not template.images:
             logger.warning("No images specified in the template")
-            return
-        
+            return {}
+
         # Define the image types to process
         image_types = {
             'logo': template.images.logo,
@@ -508,82 +724,77 @@ class ApplePass(BasePass):
             'footer': template.images.footer,
             'thumbnail': template.images.thumbnail
         }
-        
+
+        sources: Dict[str, Path] = {}
         for image_type, image_path in image_types.items():
             if not image_path:
                 # Skip images that aren't specified
                 continue
-            
-            # Check if the image file exists
-            image_path_obj = Path(image_path)
-            if not image_path_obj.exists():
+
+            # Check if the image file exists (cached stat; multi-platform
+            # flows resolve the same asset once per platform)
+            resolved = PassImages._resolve(str(image_path))
+            if resolved is None:
                 if image_type == 'icon':
                     logger.error(f"Required image '{image_type}' not found at {image_path}")
                 else:
                     logger.warning(f"Image file not found: {image_path}")
                 continue
-            
-            # Copy the image to the temporary directory with the correct name
-            target_path = temp_path / f"{image_type}.png"
-            shutil.copy2(image_path_obj, target_path)
-            logger.debug(f"Copied {image_path} to {target_path}")
-            
+            image_path_obj = resolved[0]
+            sources[f"{image_type}.png"] = image_path_obj
+
             # Check for a @2x version using naming convention
             retina_path = image_path_obj.parent / f"{image_path_obj.stem}@2x{image_path_obj.suffix}"
-            if retina_path.exists():
-                retina_target_path = temp_path / f"{image_type}@2x.png"
-                shutil.copy2(retina_path, retina_target_path)
-                logger.debug(f"Copied {retina_path} to {retina_target_path}")
-    
-    def _create_manifest(self, pass_dir: Path) -> Dict[str, str]:
-        """Create the pass manifest with SHA1 hashes of all files."""
-        manifest = {}
-        
-        for file_path in pass_dir.glob('*'):
-            # Skip the manifest itself and the signature
-            if file_path.name in ('manifest.json', 'signature'):
-                continue
-            
-            # Compute the SHA1 hash of the file
-            with open(file_path, 'rb') as f:
-                file_data = f.read()
-                sha1_hash = hashlib.sha1(file_data).hexdigest()
-            
-            manifest[file_path.name] = sha1_hash
-        
-        return manifest
+            if PassImages._resolve(str(retina_path)) is not None:
+                sources[f"{image_type}@2x.png"] = retina_path
+
+        blobs = read_all(sources.values())
+        images = {name: blobs[path] for name, path in sources.items()}
+        self._image_cache[template.id] = images
+        return images
     
-    def _sign_manifest(self, manifest: Dict[str, str]) -> bytes:
-        """Sign the manifest with the certificate and private key."""
-        # Create a PKCS7 signature
-        manifest_json = json.dumps(manifest).encode()
-        
-        # Create the PKCS7 object
-        p7 = crypto.PKCS7()
-        
-        # Set the type to signed
-        p7.type_is_signed()
-        
-        # Set the content
-        bio = crypto._new_mem_buf(manifest_json)
-        p7.set_content(bio)
-        
-        # Add the signer certificate and key
-        p7.add_signer(self._certificate, self._private_key, crypto.PKCS7_BINARY)
-        
-        # Add the WWDR certificate
-        p7.add_certificate(self._wwdr_certificate)
-        
-        # Sign the manifest
-        p7.sign(None, 0)
-        
-        # Get the signature
-        signature = crypto.PKCS7_to_der(p7)
-        
-        return signature
+    @staticmethod
+    def _hash_files(files: Dict[str, bytes]) -> Dict[str, str]:
+        """Compute the manifest SHA-1 for each bundle file.
+
+        Single-file bundles are hashed inline; larger bundles fan the
+        hashes out over a short-lived thread pool, which scales nearly
+        linearly because hashlib releases the GIL for non-trivial buffers.
+        Results keep the input order.
+        """
+        if len(files) <= 1:
+            return {name: hashlib.sha1(data).hexdigest() for name, data in files.items()}
+
+        def _sha1_hex(data: bytes) -> str:
+            return hashlib.sha1(data).hexdigest()
+
+        with ThreadPoolExecutor(max_workers=min(len(files), 4)) as executor:
+            return dict(zip(files, executor.map(_sha1_hex, files.values())))
+
+    def _sign_manifest(self, manifest_bytes: bytes) -> bytes:
+        """Sign the serialized manifest with the certificate and private key.
+
+        Produces a detached DER-encoded PKCS7 signature over the exact
+        manifest.json bytes the caller archives, with the WWDR certificate
+        included in the chain. Taking the serialized form (rather than the
+        dict) guarantees the signed document and the archived one can never
+        diverge.
+        """
+        return (
+            pkcs7.PKCS7SignatureBuilder()
+            .set_data(manifest_bytes)
+            .add_signer(self._signing_certificate, self._signing_key, hashes.SHA256())
+            .add_certificate(self._signing_wwdr)
+            .sign(
+                serialization.Encoding.DER,
+                [pkcs7.PKCS7Options.Binary, pkcs7.PKCS7Options.DetachedSignature],
+            )
+        )
     
     def _store_pass_data(self, pass_id: str, pass_json: Dict[str, Any]) -> None:
         """Store the pass data for retrieval."""
+        # Drop any cached response; mtime alone can miss same-tick rewrites
+        self._response_cache.pop(pass_id, None)
         self.storage.store_pass("apple", pass_id, pass_json)
     
     def _retrieve_pass_data(self, pass_id: str) -> Dict[str, Any]:
@@ -594,9 +805,12 @@ class ApplePass(BasePass):
             raise AppleWalletError(f"Pass not found: {pass_id}")
     
     def _generate_authentication_token(self) -> str:
-        """Generate a random authentication token."""
-        token_bytes = os.urandom(16)
-        return base64.b64encode(token_bytes).decode('utf-8')
+        """Generate a random authentication token.
+
+        Uses the URL-safe alphabet so the token never needs escaping when
+        embedded in web service URLs.
+        """
+        return secrets.token_urlsafe(16)
     
     def _generate_pass_url(self, pass_id: str) -> Optional[str]:
         """Generate a URL for downloading the pass."""
@@ -0,0 +1,117 @@
+"""Async facade over PassManager for event-loop based servers."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from ..config import WalletConfig
+from ..schema.core import PassData, PassResponse, PassTemplate
+from ..storage import StorageBackend
+from ..logging import get_logger
+from .manager import PassManager
+
+logger = get_logger(__name__)
+
+
+class AsyncPassManager:
+    """Async wrapper around PassManager.
+
+    Pass operations are dominated by signing and outbound HTTPS; calling
+    the sync manager directly from a coroutine would block the event loop
+    for the whole round trip. This facade runs each call on a worker
+    thread (asyncio.to_thread), so a server coroutine can keep thousands
+    of passes in flight with one await each. Per-platform fan-out still
+    happens inside PassManager on its shared executor, so Apple and
+    Google work overlaps exactly as it does in the sync API.
+
+    The providers themselves are synchronous (local crypto for Apple, the
+    blocking Google API client for Google), so offloading to threads is
+    the whole story here; if a provider ever grows a native async
+    transport, its methods can be awaited directly from these wrappers
+    without changing the interface.
+    """
+
+    def __init__(
+        self,
+        config: Optional[WalletConfig] = None,
+        *,
+        manager: Optional[PassManager] = None,
+        storage: Optional[StorageBackend] = None,
+    ):
+        """Initialize from a config, or wrap an existing PassManager.
+
+        Args:
+            config: Wallet configuration used to build a manager
+            manager: Already-constructed PassManager to wrap instead
+            storage: Storage backend for a newly built manager
+        """
+        if manager is None:
+            if config is None:
+                raise ValueError("AsyncPassManager requires a config or a manager")
+            manager = PassManager(config, storage=storage)
+        self.manager = manager
+
+    async def create_pass(
+        self, pass_data: PassData, template: PassTemplate, create_for: Optional[List[str]] = None
+    ) -> Dict[str, PassResponse]:
+        """Create a pass across platforms without blocking the event loop."""
+        return await asyncio.to_thread(self.manager.create_pass, pass_data, template, create_for)
+
+    async def create_passes_bulk(
+        self,
+        pass_datas: List[PassData],
+        template: PassTemplate,
+        create_for: Optional[List[str]] = None,
+    ) -> List[Dict[str, PassResponse]]:
+        """Create many passes concurrently, one task per pass.
+
+        Results come back in input order; a pass that failed on every
+        platform yields an empty dict, matching the sync bulk API.
+        """
+        from ..exceptions import PassCreationError
+
+        async def _one(pass_data: PassData) -> Dict[str, PassResponse]:
+            try:
+                return await self.create_pass(pass_data, template, create_for)
+            except PassCreationError as e:
+                logger.error("Failed to create pass in bulk batch: {}", e)
+                return {}
+
+        return list(await asyncio.gather(*(_one(pass_data) for pass_data in pass_datas)))
+
+    async def update_pass(
+        self, pass_id: str, pass_data: PassData, template: PassTemplate, update_for: Optional[List[str]] = None
+    ) -> Dict[str, PassResponse]:
+        """Update a pass across platforms without blocking the event loop."""
+        return await asyncio.to_thread(self.manager.update_pass, pass_id, pass_data, template, update_for)
+
+    async def void_pass(
+        self, pass_id: str, template: PassTemplate, void_for: Optional[List[str]] = None
+    ) -> Dict[str, PassResponse]:
+        """Void a pass across platforms without blocking the event loop."""
+        return await asyncio.to_thread(self.manager.void_pass, pass_id, template, void_for)
+
+    async def generate_pass_files(
+        self, pass_id: str, template: PassTemplate, platforms: Optional[List[str]] = None
+    ) -> Dict[str, bytes]:
+        """Generate pass files across platforms without blocking the event loop."""
+        return await asyncio.to_thread(self.manager.generate_pass_files, pass_id, template, platforms)
+
+    async def send_update_notification(
+        self, pass_id: str, template: PassTemplate, platforms: Optional[List[str]] = None
+    ) -> Dict[str, bool]:
+        """Send update notifications without blocking the event loop."""
+        return await asyncio.to_thread(self.manager.send_update_notification, pass_id, template, platforms)
+
+    async def send_update_notifications_bulk(
+        self,
+        pass_ids: List[str],
+        template: PassTemplate,
+        platforms: Optional[List[str]] = None,
+        batch_size: int = 500,
+    ) -> Dict[str, Dict[str, bool]]:
+        """Send batched update notifications without blocking the event loop."""
+        return await asyncio.to_thread(
+            self.manager.send_update_notifications_bulk, pass_ids, template, platforms, batch_size
+        )
@@ -1,7 +1,7 @@
 """Base classes for wallet pass management."""
 
 import abc
-from typing import Optional
+from typing import Dict, List, Optional
 
 from ..config import WalletConfig
 from ..schema.core import PassData, PassResponse, PassTemplate
@@ -13,7 +13,11 @@ logger = get_logger(__name__)
 
 class BasePass(abc.ABC):
     """Abstract base class for wallet pass implementations."""
-    
+
+    # No per-instance __dict__ at this level; concrete providers that add
+    # ad-hoc attributes still get one of their own
+    __slots__ = ("config", "storage", "__weakref__")
+
     def __init__(self, config: WalletConfig, storage: Optional[StorageBackend] = None):
         """Initialize with configuration."""
         self.config = config
@@ -47,4 +51,21 @@ class BasePass(abc.ABC):
     @abc.abstractmethod
     def send_update_notification(self, pass_id: str) -> bool:
         """Send a push notification for pass updates."""
-        pass
\ No newline at end of file
+        pass
+
+    def send_update_notifications(self, pass_ids: List[str]) -> Dict[str, bool]:
+        """Send push notifications for a batch of passes.
+
+        The default implementation loops over send_update_notification.
+        Providers whose transport supports batched delivery (APNs HTTP/2
+        stream multiplexing, FCM multicast sends) should override this to
+        reuse a single connection for the whole batch instead of paying
+        per-pass connection setup.
+
+        Args:
+            pass_ids: IDs of the passes to notify
+
+        Returns:
+            Dict mapping pass ID to success status
+        """
+        return {pass_id: self.send_update_notification(pass_id) for pass_id in pass_ids}
\ No newline at end of file
@@ -1,6 +1,5 @@
 """Google Wallet pass implementation."""
 
-import json
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -9,6 +8,7 @@ from typing import Any, Dict, List, Optional, Union
 from ..config import WalletConfig
 from ..exceptions import GoogleWalletError, PassCreationError
 from ..schema.core import PassData, PassResponse, PassTemplate, PassType, Barcode, PassField
+from ..serialization import dumps_bytes
 from ..storage import StorageBackend, FileSystemStorage
 from ..logging import get_logger, with_context
 from .base import BasePass
@@ -113,8 +113,10 @@ class GooglePass(BasePass):
             # Generate a Google Pay link
             pass_url = self._generate_save_link(object_id)
             
-            # Return the pass response
-            return PassResponse(
+            # Return the pass response; the values are all internally
+            # sourced and already typed, so model_construct skips the
+            # redundant validation pass
+            return PassResponse.model_construct(
                 id=object_id,
                 template_id=template.id,
                 customer_id=pass_data.customer_id,
@@ -151,7 +153,7 @@ class GooglePass(BasePass):
             self._store_pass_data(pass_id, pass_payload)
             
             # Return the updated pass response
-            return PassResponse(
+            return PassResponse.model_construct(
                 id=pass_id,
                 template_id=template.id,
                 customer_id=pass_data.customer_id,
@@ -184,7 +186,7 @@ class GooglePass(BasePass):
             voided = wallet_object.get('state', '') == 'INACTIVE'
             
             # Create a pass response
-            return PassResponse(
+            return PassResponse.model_construct(
                 id=pass_id,
                 template_id=template_id,
                 customer_id=wallet_object.get('customerId', ''),
@@ -227,11 +229,9 @@ class GooglePass(BasePass):
         try:
             # Retrieve the pass data
             pass_payload = self._retrieve_pass_data(pass_id)
-            
-            # Convert to JSON string
-            pass_json = json.dumps(pass_payload, indent=2)
-            
-            return pass_json.encode('utf-8')
+
+            # Serialize straight to bytes (orjson-backed)
+            return dumps_bytes(pass_payload, indent=True)
         except Exception as e:
             raise GoogleWalletError(f"Failed to generate Google pass file: {e}")
     
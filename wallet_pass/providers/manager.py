@@ -1,7 +1,13 @@
 from __future__ import annotations
 
 import abc
-from typing import Any, Dict, List, Optional, Union
+import functools
+import importlib
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING, Union
 
 from ..config import WalletConfig
 from ..exceptions import PassCreationError
@@ -11,38 +17,79 @@ from ..logging import get_logger, with_context
 
 logger = get_logger(__name__)
 
-# Check for optional providers
-try:
+if TYPE_CHECKING:
     from .apple_pass import ApplePass
-except ImportError:
-    class ApplePass:
-        def __init__(self, *args, **kwargs):
-            pass
-    ApplePass._dummy = True  # Mark as dummy implementation
-    logger.debug("⚠️ Apple Wallet provider not available (missing dependencies)")
-
-try:
     from .google_pass import GooglePass
-except ImportError:
-    class GooglePass:
-        def __init__(self, *args, **kwargs):
-            pass
-    GooglePass._dummy = True  # Mark as dummy implementation
-    logger.debug("⚠️ Google Wallet provider not available (missing dependencies)")
-
-try:
     from .samsung_pass import SamsungPass
-except ImportError:
-    class SamsungPass:
-        def __init__(self, *args, **kwargs):
-            pass
-    SamsungPass._dummy = True  # Mark as dummy implementation
-    logger.debug("⚠️ Samsung Wallet provider not available (missing dependencies)")
+
+
+# Provider classes are resolved on first use rather than at module import:
+# each pulls in heavy optional dependencies (pyOpenSSL, the Google API
+# client), so importing them eagerly taxed every `import wallet_pass` even
+# when the configuration only enables one platform.
+@functools.lru_cache(maxsize=None)
+def _load_provider(module_name: str, class_name: str):
+    """Import a provider class, or None when its dependencies are missing."""
+    try:
+        module = importlib.import_module(f".{module_name}", __package__)
+    except ImportError:
+        logger.debug("⚠️ {} provider not available (missing dependencies)", class_name)
+        return None
+    return getattr(module, class_name)
+
+
+# Canonical pass-type members per platform, built once at import. Membership
+# is a single hash lookup on the hot dispatch path instead of an attribute
+# access plus a string-prefix scan per call. Iterating PassType only yields
+# canonical members, so aliased values (e.g. the shared "eventTicket") land
+# in the same set the name-prefix check resolved them to.
+_APPLE_TYPES = frozenset(t for t in PassType if t.name.startswith("APPLE_"))
+_GOOGLE_TYPES = frozenset(t for t in PassType if t.name.startswith("GOOGLE_"))
+_SAMSUNG_TYPES = frozenset(t for t in PassType if t.name.startswith("SAMSUNG_"))
+
+# Default platform targets; also the normalization target for caller lists
+_ALL_PLATFORMS = frozenset(("apple", "google", "samsung"))
+
+# Sentinel distinguishing "no error default" from an explicit None/False
+_MISSING = object()
+
+
+def _generate_serial_numbers(count: int) -> List[str]:
+    """Generate random serial numbers with a single entropy read.
+
+    uuid.uuid4() issues one getrandom syscall per call; for bulk creation
+    this draws all the randomness at once and slices it, so minting N
+    serials costs one syscall instead of N. Serials use the 32-character
+    hex form (no dashes), same format create_pass assigns.
+    """
+    random_bytes = os.urandom(16 * count)
+    return [
+        uuid.UUID(bytes=random_bytes[i * 16:(i + 1) * 16], version=4).hex
+        for i in range(count)
+    ]
 
 
 class PassManager:
     """Manager for handling both Apple and Google wallet passes."""
-    
+
+    # Fixed attribute set; dropping the per-instance __dict__ trims ~100
+    # bytes per manager, which adds up for per-tenant manager pools
+    __slots__ = (
+        "config",
+        "_apple_pass",
+        "_google_pass",
+        "_samsung_pass",
+        "storage",
+        "_executor",
+        "_provider_lock",
+        "_specializations",
+        "_apple_available",
+        "_google_available",
+        "_samsung_available",
+        "_providers",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         config: WalletConfig,
@@ -53,68 +100,178 @@ class PassManager:
     ):
         """Initialize with pass implementations."""
         self.config = config
-        self.apple_pass = apple_pass
-        self.google_pass = google_pass
-        self.samsung_pass = samsung_pass
-        
+
+        # Providers are constructed lazily on first access (see the
+        # apple_pass/google_pass/samsung_pass properties); _MISSING marks
+        # "not resolved yet" so an explicit None from a failed build is
+        # not retried on every call
+        self._apple_pass = apple_pass if apple_pass is not None else _MISSING
+        self._google_pass = google_pass if google_pass is not None else _MISSING
+        self._samsung_pass = samsung_pass if samsung_pass is not None else _MISSING
+        self._provider_lock = threading.Lock()
+
+        # Shared executor for multi-platform fan-out; created lazily on the
+        # first call that targets more than one platform
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # Specialized create_pass closures, keyed by (template, platforms);
+        # see specialize()
+        self._specializations: Dict[Any, Any] = {}
+
         # Initialize storage backend if not provided
         self.storage = storage or FileSystemStorage(config.storage_path)
-        
-        # Initialize pass providers if not provided
-        if not self.apple_pass and self._has_apple_config():
-            try:
-                self.apple_pass = ApplePass(config, storage=self.storage)
-                logger.info("💾 Apple Wallet provider initialized successfully")
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to initialize Apple Pass provider: {e}")
-        
-        if not self.google_pass and self._has_google_config():
-            try:
-                self.google_pass = GooglePass(config, storage=self.storage)
-                logger.info("💾 Google Wallet provider initialized successfully")
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to initialize Google Pass provider: {e}")
-        
-        if not self.samsung_pass and self._has_samsung_config():
-            try:
-                self.samsung_pass = SamsungPass(config, storage=self.storage)
-                logger.info("💾 Samsung Wallet provider initialized successfully")
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to initialize Samsung Pass provider: {e}")
-    
+
+        # Evaluate the config predicates once; the config does not change
+        # over the manager's lifetime, so every later call reuses these
+        self._apple_available = self._has_apple_config()
+        self._google_available = self._has_google_config()
+        self._samsung_available = self._has_samsung_config()
+
+        # Data-driven dispatch table: every public method iterates this
+        # instead of repeating the per-platform predicate chain, so adding
+        # a platform means one more row here rather than a new branch in
+        # each of the five fan-out methods. Rows name the provider
+        # property, so providers only get built when a call actually
+        # targets their platform
+        self._providers = [
+            ("apple", "apple_pass", _APPLE_TYPES),
+            ("google", "google_pass", _GOOGLE_TYPES),
+            ("samsung", "samsung_pass", _SAMSUNG_TYPES),
+        ]
+
+    def _build_provider(self, attr: str, module_name: str, class_name: str,
+                        label: str, available: bool, **extra) -> Optional[Any]:
+        """Resolve a provider on first access, caching the outcome.
+
+        Provider constructors do disk reads and key parsing, so the work
+        is deferred until a call actually targets the platform; a manager
+        configured for several platforms but used for one never pays for
+        the rest. A failed build caches None so the error is logged once,
+        not per call.
+        """
+        with self._provider_lock:
+            provider = getattr(self, f"_{attr}")
+            if provider is not _MISSING:
+                return provider
+
+            provider = None
+            cls = _load_provider(module_name, class_name) if available else None
+            if cls:
+                try:
+                    provider = cls(self.config, storage=self.storage, **extra)
+                    logger.info("💾 {} Wallet provider initialized successfully", label)
+                except Exception as e:
+                    logger.warning("⚠️ Failed to initialize {} Pass provider: {}", label, e)
+
+            setattr(self, f"_{attr}", provider)
+            return provider
+
+    @property
+    def apple_pass(self) -> Optional["ApplePass"]:
+        """Apple Wallet provider, constructed on first access."""
+        if self._apple_pass is not _MISSING:
+            return self._apple_pass
+        return self._build_provider(
+            "apple_pass", "apple_pass", "ApplePass", "Apple", self._apple_available
+        )
+
+    @apple_pass.setter
+    def apple_pass(self, value: Optional["ApplePass"]) -> None:
+        self._apple_pass = value
+
+    @property
+    def google_pass(self) -> Optional["GooglePass"]:
+        """Google Wallet provider, constructed on first access."""
+        if self._google_pass is not _MISSING:
+            return self._google_pass
+        return self._build_provider(
+            "google_pass", "google_pass", "GooglePass", "Google", self._google_available
+        )
+
+    @google_pass.setter
+    def google_pass(self, value: Optional["GooglePass"]) -> None:
+        self._google_pass = value
+
+    @property
+    def samsung_pass(self) -> Optional["SamsungPass"]:
+        """Samsung Wallet provider, constructed on first access."""
+        if self._samsung_pass is not _MISSING:
+            return self._samsung_pass
+        return self._build_provider(
+            "samsung_pass", "samsung_pass", "SamsungPass", "Samsung",
+            self._samsung_available,
+        )
+
+    @samsung_pass.setter
+    def samsung_pass(self, value: Optional["SamsungPass"]) -> None:
+        self._samsung_pass = value
+
     def _has_apple_config(self) -> bool:
         """Check if Apple Wallet configuration is available."""
-        return all([
-            self.config.apple_pass_type_identifier,
-            self.config.apple_team_identifier,
-            self.config.apple_certificate_path,
-            self.config.apple_private_key_path,
-            self.config.apple_wwdr_certificate_path,
-        ])
-    
+        # Chained `and` short-circuits on the first missing value and skips
+        # the list-plus-all() allocation; called once per manager
+        config = self.config
+        return bool(
+            config.apple_pass_type_identifier
+            and config.apple_team_identifier
+            and config.apple_certificate_path
+            and config.apple_private_key_path
+            and config.apple_wwdr_certificate_path
+        )
+
     def _has_google_config(self) -> bool:
         """Check if Google Wallet configuration is available."""
-        return all([
-            self.config.google_application_credentials,
-            self.config.google_issuer_id,
-        ])
-    
+        config = self.config
+        return bool(config.google_application_credentials and config.google_issuer_id)
+
     def _has_samsung_config(self) -> bool:
         """Check if Samsung Wallet configuration is available."""
-        required_attrs = ['samsung_issuer_id', 'samsung_api_key', 'samsung_service_id']
-        return all(hasattr(self.config, attr) and getattr(self.config, attr) for attr in required_attrs)
+        config = self.config
+        return bool(
+            getattr(config, 'samsung_issuer_id', None)
+            and getattr(config, 'samsung_api_key', None)
+            and getattr(config, 'samsung_service_id', None)
+        )
     
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the shared fan-out executor, creating it on first use.
+
+        Platform operations are independent network/crypto-bound calls, so
+        a small persistent pool lets dual-platform requests overlap Apple
+        signing latency with Google/Samsung API latency instead of paying
+        them back to back.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="wallet-pass")
+        return self._executor
+
+    def close(self) -> None:
+        """Release the shared executor.
+
+        Safe to call more than once; managers used as context managers
+        get this automatically on exit.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> "PassManager":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def _is_apple_pass_type(self, pass_type: PassType) -> bool:
         """Check if the pass type is for Apple Wallet."""
-        return pass_type.name.startswith("APPLE_")
-    
+        return pass_type in _APPLE_TYPES
+
     def _is_google_pass_type(self, pass_type: PassType) -> bool:
         """Check if the pass type is for Google Wallet."""
-        return pass_type.name.startswith("GOOGLE_")
-    
+        return pass_type in _GOOGLE_TYPES
+
     def _is_samsung_pass_type(self, pass_type: PassType) -> bool:
         """Check if the pass type is for Samsung Wallet."""
-        return pass_type.name.startswith("SAMSUNG_")
+        return pass_type in _SAMSUNG_TYPES
     
     def create_pass(
         self, pass_data: PassData, template: PassTemplate, create_for: Optional[List[str]] = None
@@ -138,50 +295,250 @@ class PassManager:
             customer_id=pass_data.customer_id
         )
         
+        # Normalize to a frozenset so membership checks are O(1) even when
+        # callers pass large lists
         if create_for is None:
-            create_for = ["apple", "google", "samsung"]
-            logger.bind(**context).debug(f"Creating pass for all platforms: {create_for}")
+            targets = _ALL_PLATFORMS
+            logger.bind(**context).debug("Creating pass for all platforms: {}", sorted(targets))
         else:
-            logger.bind(**context).debug(f"Creating pass for platforms: {create_for}")
-        
+            targets = frozenset(create_for)
+            logger.bind(**context).debug("Creating pass for platforms: {}", create_for)
+
+        # Collect the providers eligible for this pass
+        tasks = self._create_tasks(template, targets)
+        return self._execute_create(tasks, pass_data, template, context)
+
+    def _create_tasks(self, template: PassTemplate, targets: frozenset) -> List[tuple]:
+        """Build the (platform, provider, success message) create task list."""
+        apple_emoji, other_emoji = "🍏", "📱"
+        return [
+            (name, provider, f"{apple_emoji if name == 'apple' else other_emoji} Created {name.capitalize()} Wallet pass")
+            for name, attr, types in self._providers
+            if name in targets and template.pass_type in types
+            and (provider := getattr(self, attr))
+        ]
+
+    def _execute_create(
+        self, tasks: List[tuple], pass_data: PassData, template: PassTemplate, context: Dict[str, Any]
+    ) -> Dict[str, PassResponse]:
+        """Run the create task list, fanning out when more than one platform."""
         result = {}
-        
-        # Generate a common serial number if not provided
+
+        # Generate a common serial number if not provided; .hex skips the
+        # dash formatting of str(uuid4())
         if not pass_data.serial_number:
-            import uuid
-            pass_data.serial_number = str(uuid.uuid4())
-            logger.bind(**context).debug(f"Generated serial number: {pass_data.serial_number}")
-        
-        # Create passes for specified platforms
-        if "apple" in create_for and self.apple_pass and self._is_apple_pass_type(template.pass_type):
-            try:
-                result["apple"] = self.apple_pass.create_pass(pass_data, template)
-                logger.bind(**context).info("🍏 Created Apple Wallet pass")
-            except Exception as e:
-                logger.bind(**context).error(f"❌ Failed to create Apple Wallet pass: {e}")
-        
-        if "google" in create_for and self.google_pass and self._is_google_pass_type(template.pass_type):
-            try:
-                result["google"] = self.google_pass.create_pass(pass_data, template)
-                logger.bind(**context).info("📱 Created Google Wallet pass")
-            except Exception as e:
-                logger.bind(**context).error(f"❌ Failed to create Google Wallet pass: {e}")
-        
-        if "samsung" in create_for and self.samsung_pass and self._is_samsung_pass_type(template.pass_type):
-            try:
-                result["samsung"] = self.samsung_pass.create_pass(pass_data, template)
-                logger.bind(**context).info("📱 Created Samsung Wallet pass")
-            except Exception as e:
-                logger.bind(**context).error(f"❌ Failed to create Samsung Wallet pass: {e}")
-        
+            pass_data.serial_number = uuid.uuid4().hex
+            logger.bind(**context).debug("Generated serial number: {}", pass_data.serial_number)
+
+        if len(tasks) > 1:
+            # Platform pipelines are independent (signing, API calls, file
+            # writes), so fan out across the shared thread pool when more
+            # than one platform is targeted
+            executor = self._get_executor()
+            futures = {
+                executor.submit(provider.create_pass, pass_data, template): (platform, success_msg)
+                for platform, provider, success_msg in tasks
+            }
+            for future in as_completed(futures):
+                platform, success_msg = futures[future]
+                try:
+                    result[platform] = future.result()
+                    logger.bind(**context).info(success_msg)
+                except Exception as e:
+                    logger.bind(**context).error("❌ Failed to create {} Wallet pass: {}", platform.capitalize(), e)
+        else:
+            for platform, provider, success_msg in tasks:
+                try:
+                    result[platform] = provider.create_pass(pass_data, template)
+                    logger.bind(**context).info(success_msg)
+                except Exception as e:
+                    logger.bind(**context).error("❌ Failed to create {} Wallet pass: {}", platform.capitalize(), e)
+
         if not result:
             error_msg = "Failed to create passes: No compatible pass platforms available"
-            logger.bind(**context).error(f"❌ {error_msg}")
+            logger.bind(**context).error("❌ {}", error_msg)
             raise PassCreationError(error_msg)
         
-        logger.bind(**context).success(f"🎉 Successfully created passes for {list(result.keys())}")
+        logger.bind(**context).success("🎉 Successfully created passes for {}", list(result.keys()))
         return result
-    
+
+    def specialize(
+        self, template: PassTemplate, platforms: Optional[List[str]] = None
+    ) -> Callable[[PassData], Dict[str, PassResponse]]:
+        """Pre-bind create_pass for a fixed template and platform set.
+
+        High-QPS endpoints that mint passes from one template evaluate the
+        same dispatch predicates on every request. This resolves the
+        eligible providers once and returns a callable taking only the
+        per-pass data, so the hot path skips target normalization and
+        provider filtering entirely. Specializations are cached per
+        (template, platforms) pair; bind the callable at startup and call
+        it per request.
+
+        A pre-bound closure gives the same dead-branch elimination as
+        generated code without an exec step. The closure captures the
+        provider list as of this call — specialize again if providers are
+        swapped out.
+
+        Args:
+            template: Template every pass will use
+            platforms: Platforms to create for (defaults to all)
+
+        Returns:
+            Callable mapping PassData to a platform-to-response dict
+
+        Raises:
+            PassCreationError: If no compatible platform is available
+        """
+        targets = _ALL_PLATFORMS if platforms is None else frozenset(platforms)
+        cache_key = (id(template), targets)
+        cached = self._specializations.get(cache_key)
+        if cached is not None:
+            return cached
+
+        tasks = self._create_tasks(template, targets)
+        if not tasks:
+            raise PassCreationError(
+                "Failed to specialize create_pass: No compatible pass platforms available"
+            )
+
+        base_context = with_context(
+            action="create_pass",
+            template_id=template.id,
+            template_name=template.name,
+            pass_type=template.pass_type.value,
+        )
+
+        def create(pass_data: PassData) -> Dict[str, PassResponse]:
+            context = dict(base_context, customer_id=pass_data.customer_id)
+            return self._execute_create(tasks, pass_data, template, context)
+
+        self._specializations[cache_key] = create
+        return create
+
+    def create_passes_bulk(
+        self,
+        pass_datas: List[PassData],
+        template: PassTemplate,
+        create_for: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[Dict[str, PassResponse]]:
+        """
+        Create many passes from one template in parallel.
+
+        Ticketing flows mint N passes per order; each one involves
+        independent signing and API work, so they are spread across a
+        worker pool. Serial numbers for passes that lack one are drawn
+        up front with a single entropy read. Threads rather than
+        processes: the providers hold unpicklable state (parsed
+        certificates, storage handles) and the crypto hot spots run in C
+        extensions that release the GIL.
+
+        Args:
+            pass_datas: Data for each pass to create
+            template: Template shared by all the passes
+            create_for: List of platforms to create for ("apple", "google", or both)
+            max_workers: Worker-thread count (defaults to the CPU count)
+
+        Returns:
+            One platform-to-response dict per input, in input order. A
+            pass whose creation failed on every platform yields an empty
+            dict; the error is logged rather than raised so one bad pass
+            does not abort the batch.
+        """
+        if not pass_datas:
+            return []
+
+        # Assign missing serials with one os.urandom read for the batch
+        missing = [pass_data for pass_data in pass_datas if not pass_data.serial_number]
+        for pass_data, serial in zip(missing, _generate_serial_numbers(len(missing))):
+            pass_data.serial_number = serial
+
+        if len(pass_datas) == 1:
+            try:
+                return [self.create_pass(pass_datas[0], template, create_for)]
+            except PassCreationError as e:
+                logger.error("Failed to create pass in bulk batch: {}", e)
+                return [{}]
+
+        results: List[Dict[str, PassResponse]] = []
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            futures = [
+                executor.submit(self.create_pass, pass_data, template, create_for)
+                for pass_data in pass_datas
+            ]
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    logger.error("Failed to create pass in bulk batch: {}", e)
+                    results.append({})
+
+        return results
+
+    def _dispatch(
+        self,
+        method_name: str,
+        targets: frozenset,
+        template: PassTemplate,
+        args: tuple,
+        error_message: str,
+        default_on_error: Any = _MISSING,
+    ) -> Dict[str, Any]:
+        """Run one provider method across the eligible platforms.
+
+        Shared engine behind update/void/generate/notify: filters the
+        dispatch table by target set and pass type, calls
+        getattr(provider, method_name)(*args) per platform (fanning out on
+        the shared executor when more than one is eligible), and applies
+        the uniform log-and-continue error handling.
+
+        Args:
+            method_name: Provider method to invoke
+            targets: Normalized platform target set
+            template: Template whose pass type gates eligibility
+            args: Positional arguments for the provider method
+            error_message: Log template with two slots (platform label, error)
+            default_on_error: Value recorded for a failed platform; omitted
+                from the result entirely when not given
+
+        Returns:
+            Dict mapping platform to the provider method's return value
+        """
+        tasks = [
+            (name, provider, name.capitalize())
+            for name, attr, types in self._providers
+            if name in targets and template.pass_type in types
+            and (provider := getattr(self, attr))
+        ]
+
+        result: Dict[str, Any] = {}
+
+        if len(tasks) > 1:
+            executor = self._get_executor()
+            futures = {
+                executor.submit(getattr(provider, method_name), *args): (platform, label)
+                for platform, provider, label in tasks
+            }
+            for future in as_completed(futures):
+                platform, label = futures[future]
+                try:
+                    result[platform] = future.result()
+                except Exception as e:
+                    logger.error(error_message, label, e)
+                    if default_on_error is not _MISSING:
+                        result[platform] = default_on_error
+        else:
+            for platform, provider, label in tasks:
+                try:
+                    result[platform] = getattr(provider, method_name)(*args)
+                except Exception as e:
+                    logger.error(error_message, label, e)
+                    if default_on_error is not _MISSING:
+                        result[platform] = default_on_error
+
+        return result
+
     def update_pass(
         self, pass_id: str, pass_data: PassData, template: PassTemplate, update_for: Optional[List[str]] = None
     ) -> Dict[str, PassResponse]:
@@ -197,30 +554,12 @@ class PassManager:
         Returns:
             Dict mapping platform to pass response
         """
-        if update_for is None:
-            update_for = ["apple", "google", "samsung"]
-        
-        result = {}
-        
-        # Update passes for specified platforms
-        if "apple" in update_for and self.apple_pass and self._is_apple_pass_type(template.pass_type):
-            try:
-                result["apple"] = self.apple_pass.update_pass(pass_id, pass_data, template)
-            except Exception as e:
-                logger.error(f"Failed to update Apple pass: {e}")
-        
-        if "google" in update_for and self.google_pass and self._is_google_pass_type(template.pass_type):
-            try:
-                result["google"] = self.google_pass.update_pass(pass_id, pass_data, template)
-            except Exception as e:
-                logger.error(f"Failed to update Google pass: {e}")
-        
-        if "samsung" in update_for and self.samsung_pass and self._is_samsung_pass_type(template.pass_type):
-            try:
-                result["samsung"] = self.samsung_pass.update_pass(pass_id, pass_data, template)
-            except Exception as e:
-                logger.error(f"Failed to update Samsung pass: {e}")
-        
+        targets = _ALL_PLATFORMS if update_for is None else frozenset(update_for)
+        result = self._dispatch(
+            "update_pass", targets, template, (pass_id, pass_data, template),
+            "Failed to update {} pass: {}",
+        )
+
         if not result:
             raise PassCreationError(
                 f"Failed to update pass {pass_id}: No compatible pass platforms available"
@@ -242,30 +581,12 @@ class PassManager:
         Returns:
             Dict mapping platform to pass response
         """
-        if void_for is None:
-            void_for = ["apple", "google", "samsung"]
-        
-        result = {}
-        
-        # Void passes for specified platforms
-        if "apple" in void_for and self.apple_pass and self._is_apple_pass_type(template.pass_type):
-            try:
-                result["apple"] = self.apple_pass.void_pass(pass_id)
-            except Exception as e:
-                logger.error(f"Failed to void Apple pass: {e}")
-        
-        if "google" in void_for and self.google_pass and self._is_google_pass_type(template.pass_type):
-            try:
-                result["google"] = self.google_pass.void_pass(pass_id)
-            except Exception as e:
-                logger.error(f"Failed to void Google pass: {e}")
-        
-        if "samsung" in void_for and self.samsung_pass and self._is_samsung_pass_type(template.pass_type):
-            try:
-                result["samsung"] = self.samsung_pass.void_pass(pass_id)
-            except Exception as e:
-                logger.error(f"Failed to void Samsung pass: {e}")
-        
+        targets = _ALL_PLATFORMS if void_for is None else frozenset(void_for)
+        result = self._dispatch(
+            "void_pass", targets, template, (pass_id,),
+            "Failed to void {} pass: {}",
+        )
+
         if not result:
             raise PassCreationError(
                 f"Failed to void pass {pass_id}: No compatible pass platforms available"
@@ -278,39 +599,23 @@ class PassManager:
     ) -> Dict[str, bytes]:
         """
         Generate pass files for multiple platforms.
-        
+
         Args:
             pass_id: ID of the pass
             template: Template for the pass
             platforms: List of platforms to generate for ("apple", "google", or both)
-        
+
         Returns:
-            Dict mapping platform to pass file bytes
+            Dict mapping platform to pass file bytes. Every value is bytes
+            (a .pkpass archive for Apple, a JSON document for Google and
+            Samsung), so results can be written with "wb" file handles as-is.
         """
-        if platforms is None:
-            platforms = ["apple", "google", "samsung"]
-        
-        result = {}
-        
-        # Generate pass files for specified platforms
-        if "apple" in platforms and self.apple_pass and self._is_apple_pass_type(template.pass_type):
-            try:
-                result["apple"] = self.apple_pass.generate_pass_file(pass_id, template)
-            except Exception as e:
-                logger.error(f"Failed to generate Apple pass file: {e}")
-        
-        if "google" in platforms and self.google_pass and self._is_google_pass_type(template.pass_type):
-            try:
-                result["google"] = self.google_pass.generate_pass_file(pass_id, template)
-            except Exception as e:
-                logger.error(f"Failed to generate Google pass file: {e}")
-        
-        if "samsung" in platforms and self.samsung_pass and self._is_samsung_pass_type(template.pass_type):
-            try:
-                result["samsung"] = self.samsung_pass.generate_pass_file(pass_id, template)
-            except Exception as e:
-                logger.error(f"Failed to generate Samsung pass file: {e}")
-        
+        targets = _ALL_PLATFORMS if platforms is None else frozenset(platforms)
+        result = self._dispatch(
+            "generate_pass_file", targets, template, (pass_id, template),
+            "Failed to generate {} pass file: {}",
+        )
+
         if not result:
             raise PassCreationError(
                 f"Failed to generate pass files for {pass_id}: No compatible pass platforms available"
@@ -318,6 +623,39 @@ class PassManager:
         
         return result
     
+    def generate_pass_files_to(
+        self, fileobj: Any, pass_id: str, template: PassTemplate, platform: str = "apple"
+    ) -> None:
+        """
+        Generate a pass file for a single platform directly into a binary stream.
+
+        Unlike generate_pass_files, this never buffers the whole pass file in
+        memory: the Apple provider streams the .pkpass archive straight into
+        the supplied stream, which keeps peak memory flat for passes with
+        large images.
+
+        Args:
+            fileobj: Writable binary stream (e.g. an open file) for the pass file
+            pass_id: ID of the pass
+            template: Template for the pass
+            platform: Platform to generate for ("apple", "google", or "samsung")
+        """
+        if platform == "apple" and self.apple_pass and self._is_apple_pass_type(template.pass_type):
+            self.apple_pass.generate_pass_file_to(fileobj, pass_id, template)
+            return
+
+        if platform == "google" and self.google_pass and self._is_google_pass_type(template.pass_type):
+            fileobj.write(self.google_pass.generate_pass_file(pass_id, template))
+            return
+
+        if platform == "samsung" and self.samsung_pass and self._is_samsung_pass_type(template.pass_type):
+            fileobj.write(self.samsung_pass.generate_pass_file(pass_id, template))
+            return
+
+        raise PassCreationError(
+            f"Failed to generate pass file for {pass_id}: No compatible pass platform '{platform}' available"
+        )
+
     def send_update_notification(
         self, pass_id: str, template: PassTemplate, platforms: Optional[List[str]] = None
     ) -> Dict[str, bool]:
@@ -332,31 +670,66 @@ class PassManager:
         Returns:
             Dict mapping platform to success status
         """
-        if platforms is None:
-            platforms = ["apple", "google", "samsung"]
-        
-        result = {}
-        
-        # Send notifications for specified platforms
-        if "apple" in platforms and self.apple_pass and self._is_apple_pass_type(template.pass_type):
-            try:
-                result["apple"] = self.apple_pass.send_update_notification(pass_id)
-            except Exception as e:
-                logger.error(f"Failed to send Apple pass notification: {e}")
-                result["apple"] = False
-        
-        if "google" in platforms and self.google_pass and self._is_google_pass_type(template.pass_type):
-            try:
-                result["google"] = self.google_pass.send_update_notification(pass_id)
-            except Exception as e:
-                logger.error(f"Failed to send Google pass notification: {e}")
-                result["google"] = False
-        
-        if "samsung" in platforms and self.samsung_pass and self._is_samsung_pass_type(template.pass_type):
+        targets = _ALL_PLATFORMS if platforms is None else frozenset(platforms)
+        return self._dispatch(
+            "send_update_notification", targets, template, (pass_id,),
+            "Failed to send {} pass notification: {}",
+            default_on_error=False,
+        )
+
+    def send_update_notifications_bulk(
+        self,
+        pass_ids: List[str],
+        template: PassTemplate,
+        platforms: Optional[List[str]] = None,
+        batch_size: int = 500,
+    ) -> Dict[str, Dict[str, bool]]:
+        """
+        Send update notifications for many passes at once.
+
+        Pass IDs are grouped into batches and handed to each platform
+        provider's send_update_notifications in parallel, so the provider
+        can amortize connection setup over the whole batch instead of
+        paying it per pass. Typical use is notifying every holder of an
+        event pass after a schedule change.
+
+        Args:
+            pass_ids: IDs of the passes to notify
+            template: Template for the passes
+            platforms: List of platforms to notify ("apple", "google", or both)
+            batch_size: Maximum number of pass IDs per provider batch
+
+        Returns:
+            Dict mapping platform to a dict of pass ID to success status
+        """
+        targets = _ALL_PLATFORMS if platforms is None else frozenset(platforms)
+
+        # Collect the providers eligible for these passes
+        tasks = [
+            (name, provider, name.capitalize())
+            for name, attr, types in self._providers
+            if name in targets and template.pass_type in types
+            and (provider := getattr(self, attr))
+        ]
+
+        result: Dict[str, Dict[str, bool]] = {platform: {} for platform, _, _ in tasks}
+        if not tasks or not pass_ids:
+            return result
+
+        batches = [pass_ids[i:i + batch_size] for i in range(0, len(pass_ids), batch_size)]
+
+        executor = self._get_executor()
+        futures = {
+            executor.submit(provider.send_update_notifications, batch): (platform, label, batch)
+            for platform, provider, label in tasks
+            for batch in batches
+        }
+        for future in as_completed(futures):
+            platform, label, batch = futures[future]
             try:
-                result["samsung"] = self.samsung_pass.send_update_notification(pass_id)
+                result[platform].update(future.result())
             except Exception as e:
-                logger.error(f"Failed to send Samsung pass notification: {e}")
-                result["samsung"] = False
-        
+                logger.error("Failed to send {} pass notifications: {}", label, e)
+                result[platform].update({pass_id: False for pass_id in batch})
+
         return result
\ No newline at end of file
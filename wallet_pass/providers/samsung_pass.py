@@ -1,6 +1,5 @@
 """Samsung Wallet pass implementation."""
 
-import json
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -9,6 +8,7 @@ from typing import Any, Dict, List, Optional, Union
 from ..config import WalletConfig
 from ..exceptions import PassCreationError, ValidationError
 from ..schema.core import PassData, PassResponse, PassTemplate, PassType, Barcode
+from ..serialization import dumps_bytes
 from ..storage import StorageBackend, FileSystemStorage
 from ..logging import get_logger, with_context
 from .base import BasePass
@@ -22,7 +22,6 @@ except ImportError:
     logger.warning("Requests library not installed. Install with: pip install requests")
     SAMSUNG_API_AVAILABLE = False
 
-
 class SamsungWalletError(Exception):
     """Raised when a Samsung Wallet operation fails."""
     pass
@@ -31,21 +30,30 @@ class SamsungWalletError(Exception):
 class SamsungPass(BasePass):
     """Implementation of Samsung Wallet passes."""
     
-    def __init__(self, config: WalletConfig, storage: Optional[StorageBackend] = None):
-        """Initialize with configuration."""
+    def __init__(
+        self,
+        config: WalletConfig,
+        storage: Optional[StorageBackend] = None,
+    ):
+        """Initialize with configuration.
+
+        Args:
+            config: Wallet configuration
+            storage: Storage backend for pass data
+        """
         super().__init__(config)
-        
+
         if not SAMSUNG_API_AVAILABLE:
             raise ImportError(
                 "Requests library not installed. Install with: pip install requests"
             )
-        
+
         # Initialize storage
         self.storage = storage or FileSystemStorage(config.storage_path)
-        
+
         # Validate required configuration
         self._validate_config()
-        
+
         # Initialize API client
         self._init_client()
     
@@ -81,9 +89,9 @@ class SamsungPass(BasePass):
             'X-ISSUER-ID': self.issuer_id,
             'X-SERVICE-ID': self.service_id
         }
-        
+
         logger.info("Samsung Wallet API client initialized")
-    
+
     def create_pass(self, pass_data: PassData, template: PassTemplate) -> PassResponse:
         """Create a new Samsung Wallet pass."""
         try:
@@ -102,8 +110,9 @@ class SamsungPass(BasePass):
             # Generate the pass URL (this would be provided by Samsung in a real implementation)
             pass_url = self._generate_pass_url(pass_id)
             
-            # Create and return the pass response
-            return PassResponse(
+            # Create and return the pass response; internally-sourced
+            # values, so model_construct skips revalidation
+            return PassResponse.model_construct(
                 id=pass_id,
                 template_id=template.id,
                 customer_id=pass_data.customer_id,
@@ -162,7 +171,7 @@ class SamsungPass(BasePass):
             updated_at = datetime.fromisoformat(pass_payload.get('updatedAt', datetime.now().isoformat()))
             
             # Create the pass response
-            return PassResponse(
+            return PassResponse.model_construct(
                 id=pass_id,
                 template_id=template_id,
                 customer_id=customer_id,
@@ -209,9 +218,9 @@ class SamsungPass(BasePass):
         try:
             # Retrieve the pass data
             pass_payload = self._retrieve_pass_data(pass_id)
-            
-            # Convert to JSON bytes
-            return json.dumps(pass_payload, indent=2).encode('utf-8')
+
+            # Serialize straight to bytes (orjson-backed)
+            return dumps_bytes(pass_payload, indent=True)
         except Exception as e:
             raise SamsungWalletError(f"Failed to generate Samsung pass file: {e}")
     
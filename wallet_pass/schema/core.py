@@ -1,15 +1,23 @@
 """Schema definitions for wallet passes."""
 
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from pydantic import BaseModel, AnyHttpUrl, Field
+from pydantic import BaseModel, AnyHttpUrl, Field, PrivateAttr
 
 
 class PassType(str, Enum):
-    """Types of wallet passes."""
-    
+    """Types of wallet passes.
+
+    Subclasses str so members compare directly against plain strings
+    (e.g. ``pass_type == "eventTicket"``) without Enum boxing — keep it
+    that way; internal dispatch relies on it.
+    """
+
     # Apple Wallet pass types
     APPLE_GENERIC = "generic"
     APPLE_COUPON = "coupon"
@@ -52,9 +60,16 @@ class Location(BaseModel):
     radius: float = 100  # meters
 
 
-class PassField(BaseModel):
-    """Represents a data field on a pass."""
-    
+@dataclass(slots=True, frozen=True)
+class PassField:
+    """Represents a data field on a pass.
+
+    A slotted dataclass rather than a pydantic model: fields are built in
+    bulk by the template helpers and per-instance validator dispatch
+    dominated template construction. They are still validated whenever the
+    enclosing pydantic models (PassStructure/PassTemplate) validate.
+    """
+
     key: str
     label: str
     value: Any
@@ -66,6 +81,13 @@ class PassField(BaseModel):
     currency_code: Optional[str] = None
     number_format: Optional[str] = None
 
+    @classmethod
+    def model_validate(cls, data: Union["PassField", Dict[str, Any]]) -> "PassField":
+        """Backward-compatible shim for the old pydantic constructor."""
+        if isinstance(data, cls):
+            return data
+        return cls(**data)
+
 
 class PassStructure(BaseModel):
     """Represents the structure of fields on a pass."""
@@ -89,7 +111,7 @@ class PassStyle(BaseModel):
 
 class PassImages(BaseModel):
     """Images used in a pass."""
-    
+
     logo: Optional[str] = None
     icon: Optional[str] = None
     thumbnail: Optional[str] = None
@@ -97,6 +119,22 @@ class PassImages(BaseModel):
     background: Optional[str] = None
     footer: Optional[str] = None
 
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _resolve(path_str: str) -> Optional[Tuple[Path, int, float]]:
+        """Resolve an image path to (Path, size, mtime), caching the stat.
+
+        Multi-platform flows look up the same asset once per platform;
+        caching the result keeps repeat checks in memory instead of hitting
+        the filesystem. Returns None when the file does not exist.
+        """
+        path = Path(path_str)
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return (path, stat.st_size, stat.st_mtime)
+
 
 class NFC(BaseModel):
     """NFC configuration for a pass."""
@@ -133,10 +171,88 @@ class PassTemplate(BaseModel):
     is_archived: bool = False
     custom_data: Dict[str, Any] = Field(default_factory=dict)
 
+    _compiled_skeleton: Optional[Tuple[bytes, Dict[str, Any]]] = PrivateAttr(default=None)
+
+    def compile(self) -> Tuple[bytes, Dict[str, Any]]:
+        """Pre-serialize this template's field structure for bulk emission.
+
+        Returns (skeleton, defaults): the skeleton is the section->fields
+        JSON document serialized once with a sentinel token in every
+        field-value slot, and defaults maps field key to the template's
+        default value. render_fields() then stamps out a per-pass document
+        with a handful of bytes.replace calls instead of re-walking the
+        field tree and re-encoding JSON for every pass. The compiled form
+        is cached on the instance; call again after mutating the structure
+        is not supported — clone() a fresh template instead.
+        """
+        if self._compiled_skeleton is not None:
+            return self._compiled_skeleton
+
+        from ..serialization import dumps_bytes
+
+        defaults: Dict[str, Any] = {}
+        sections: Dict[str, List[Dict[str, Any]]] = {}
+        for section, fields in (
+            ("header", self.structure.header_fields),
+            ("primary", self.structure.primary_fields),
+            ("secondary", self.structure.secondary_fields),
+            ("auxiliary", self.structure.auxiliary_fields),
+            ("back", self.structure.back_fields),
+        ):
+            if not fields:
+                continue
+            sections[section] = [
+                {"key": field.key, "label": field.label, "value": f"__F_{field.key}__"}
+                for field in fields
+            ]
+            for field in fields:
+                defaults[field.key] = field.value
+
+        self._compiled_skeleton = (dumps_bytes(sections), defaults)
+        return self._compiled_skeleton
+
+    def render_fields(self, field_values: Optional[Dict[str, Any]] = None) -> bytes:
+        """Emit the per-pass field document from the compiled skeleton.
+
+        Args:
+            field_values: Per-pass overrides; template defaults fill the rest
+
+        Returns:
+            The section->fields JSON document as bytes
+        """
+        from ..serialization import dumps_bytes
+
+        skeleton, defaults = self.compile()
+        field_values = field_values or {}
+
+        for key, default in defaults.items():
+            value = field_values.get(key, default)
+            skeleton = skeleton.replace(
+                b'"__F_' + key.encode() + b'__"', dumps_bytes(value)
+            )
+
+        return skeleton
+
+    def clone(self, **overrides: Any) -> "PassTemplate":
+        """Create a copy of this template with selected fields replaced.
+
+        Building a template from scratch re-runs validation over the whole
+        field tree; cloning an already-validated prototype skips that, which
+        matters when generating many passes from the same template. Overrides
+        are applied without revalidation.
+
+        Args:
+            **overrides: Template attributes to replace on the copy
+
+        Returns:
+            A new PassTemplate instance
+        """
+        return self.model_copy(deep=True, update=overrides)
+
 
 class PassData(BaseModel):
     """Data for creating a pass instance."""
-    
+
     template_id: str
     customer_id: str
     serial_number: Optional[str] = None
@@ -148,6 +264,20 @@ class PassData(BaseModel):
     voided: bool = False
     field_values: Dict[str, Any] = Field(default_factory=dict)
 
+    @cached_property
+    def field_values_blob(self) -> bytes:
+        """Canonical JSON serialization of field_values, computed once.
+
+        Multi-platform flows often carry identical field_values for the
+        Apple and Google variants of a pass; this blob (keys sorted, bytes
+        output) gives providers and callers a stable content key for
+        caching and deduplication without re-serializing the dict per
+        platform.
+        """
+        from ..serialization import dumps_bytes
+
+        return dumps_bytes(dict(sorted(self.field_values.items())))
+
 
 class PassResponse(BaseModel):
     """Response after creating a pass."""
@@ -167,4 +297,24 @@ class PassResponse(BaseModel):
     apple_pass_url: Optional[str] = None
     google_pass_url: Optional[str] = None
     apple_pass_id: Optional[str] = None
-    google_pass_id: Optional[str] = None
\ No newline at end of file
+    google_pass_id: Optional[str] = None
+
+    def to_msgpack(self) -> bytes:
+        """Serialize this response to compact MessagePack bytes.
+
+        Intended for cache entries and queue/worker payloads, where the
+        binary form is roughly half the size of JSON and skips text
+        parsing on the way back in. Datetimes are carried as ISO strings
+        and restored by from_msgpack. Requires the optional msgpack
+        dependency.
+        """
+        from ..serialization import packb
+
+        return packb(self.model_dump(mode="json"))
+
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> "PassResponse":
+        """Reconstruct a PassResponse from to_msgpack output."""
+        from ..serialization import unpackb
+
+        return cls.model_validate(unpackb(data))
\ No newline at end of file
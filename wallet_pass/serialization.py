@@ -0,0 +1,82 @@
+"""JSON serialization helpers for wallet passes.
+
+Pass generation serializes the same dict-of-strings shapes over and over
+(pass.json, Google Wallet payloads, stored pass data). orjson is several
+times faster than the standard library for these shapes and returns bytes
+directly, so no extra UTF-8 encode is needed before writing. It is an
+optional dependency; the standard library is used as a fallback.
+"""
+
+import json
+from typing import Any, Union
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.debug("⚠️ orjson not installed; falling back to stdlib json. Install with: pip install orjson")
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+
+def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes.
+
+    Args:
+        obj: Object to serialize
+        indent: Whether to pretty-print with 2-space indentation
+
+    Returns:
+        The JSON document as bytes
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, default=str, option=option)
+
+    if indent:
+        return json.dumps(obj, indent=2, default=str).encode('utf-8')
+    return json.dumps(obj, default=str).encode('utf-8')
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize a JSON document (bytes or str) to Python objects."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def packb(obj: Any) -> bytes:
+    """
+    Serialize an object to MessagePack bytes.
+
+    MessagePack payloads are roughly half the size of JSON and decode
+    without text parsing, which matters for cache entries and objects
+    shipped across worker boundaries. Requires the optional msgpack
+    dependency.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        The MessagePack document as bytes
+    """
+    if not MSGPACK_AVAILABLE:
+        raise ImportError("msgpack is not installed. Install with: pip install msgpack")
+    return msgpack.packb(obj, use_bin_type=True, default=str)
+
+
+def unpackb(data: bytes) -> Any:
+    """Deserialize a MessagePack document to Python objects."""
+    if not MSGPACK_AVAILABLE:
+        raise ImportError("msgpack is not installed. Install with: pip install msgpack")
+    return msgpack.unpackb(data, raw=False)
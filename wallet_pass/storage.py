@@ -1,13 +1,21 @@
 """Storage backends for wallet passes."""
 
 import abc
-import json
+import copy
+import hashlib
 import os
+import queue
+import sqlite3
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 from .logging import get_logger, with_context
+from .serialization import dumps_bytes, loads, packb, unpackb
 
 logger = get_logger(__name__)
 
@@ -35,50 +43,258 @@ class StorageBackend(abc.ABC):
         """List all pass IDs for a specific provider."""
         pass
 
+    def retrieve_passes(self, provider: str, pass_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Retrieve several passes at once.
+
+        The default implementation loops over retrieve_pass. Backends
+        whose per-object latency dominates (networked filesystems, remote
+        stores) should override this to issue the reads concurrently.
+
+        Args:
+            provider: Provider the passes belong to
+            pass_ids: IDs of the passes to retrieve
+
+        Returns:
+            Dict mapping pass ID to its stored data
+        """
+        return {pass_id: self.retrieve_pass(provider, pass_id) for pass_id in pass_ids}
+
+    def delete_passes(self, provider: str, pass_ids: List[str]) -> Dict[str, bool]:
+        """Delete several passes at once.
+
+        The default implementation loops over delete_pass; see
+        retrieve_passes for when to override.
+
+        Args:
+            provider: Provider the passes belong to
+            pass_ids: IDs of the passes to delete
+
+        Returns:
+            Dict mapping pass ID to whether it was deleted
+        """
+        return {pass_id: self.delete_pass(provider, pass_id) for pass_id in pass_ids}
+
 
 class FileSystemStorage(StorageBackend):
-    """File system based storage for passes."""
-    
-    def __init__(self, storage_path: Union[str, Path]):
-        """Initialize with storage path."""
+    """File system based storage for passes.
+
+    Pass files are sharded into 256 subdirectories by a one-byte hash of
+    the pass ID, keeping directory entries small enough that lookups stay
+    out of the slow path even with tens of thousands of passes. Files
+    written by older versions into the flat layout are still found on
+    retrieval and deletion.
+    """
+
+    # Parsed documents kept in the read cache per instance
+    _CACHE_MAX = 1024
+
+    # On-disk format -> file suffix for stored passes
+    _FORMAT_SUFFIX = {'json': '.json', 'msgpack': '.mpk'}
+
+    def __init__(self, storage_path: Union[str, Path], async_writes: bool = False,
+                 queue_size: int = 1024, format: str = 'json'):
+        """Initialize with storage path.
+
+        Args:
+            storage_path: Root directory for stored passes
+            async_writes: When True, store_pass serializes on the caller
+                thread but hands the disk write to a background thread and
+                returns immediately. Trades durability-at-return for
+                throughput on high-latency filesystems; call flush() to
+                wait for queued writes.
+            queue_size: Bound on queued writes before store_pass blocks
+            format: On-disk format, 'json' (default, human-readable) or
+                'msgpack' (~half the bytes, faster encode/decode; requires
+                the optional msgpack dependency). Passes written in one
+                format are not read back by an instance using the other.
+        """
+        if format not in self._FORMAT_SUFFIX:
+            raise ValueError(f"Unknown storage format: {format}")
+
         self.storage_path = Path(storage_path)
-    
+        self.format = format
+        self._suffix = self._FORMAT_SUFFIX[format]
+
+        # Shard directories known to exist; skips the makedirs round-trip
+        # on every write after the first into each shard, which is a real
+        # cost on network filesystems
+        self._known_dirs: set = set()
+
+        # LRU of parsed pass documents keyed by (provider, pass_id);
+        # writes and deletes through this instance keep it coherent.
+        # Entries are private copies, so callers can mutate what they
+        # get back without poisoning the cache
+        self._cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+
+        self.async_writes = async_writes
+        if async_writes:
+            # Serialized-but-not-yet-written documents; consulted by
+            # retrieve_pass so readers always see their own writes
+            self._pending: Dict[tuple, Dict[str, Any]] = {}
+            self._write_queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="wallet-pass-writer", daemon=True
+            )
+            self._writer.start()
+
+    @staticmethod
+    def _shard(pass_id: str) -> str:
+        """Return the two-hex-char shard directory for a pass ID."""
+        return hashlib.blake2s(pass_id.encode(), digest_size=1).hexdigest()
+
+    def _pass_path(self, provider: str, pass_id: str) -> Path:
+        """Return the sharded path for a pass file."""
+        return self.storage_path / provider / "passes" / self._shard(pass_id) / f"{pass_id}{self._suffix}"
+
+    def _legacy_pass_path(self, provider: str, pass_id: str) -> Path:
+        """Return the pre-sharding flat path for a pass file."""
+        return self.storage_path / provider / "passes" / f"{pass_id}{self._suffix}"
+
+    def _ensure_dir(self, directory: Path) -> None:
+        """Create a directory once, remembering that it exists.
+
+        Directories are never removed by this backend, so the cached
+        answer stays valid; set operations are GIL-atomic, so no lock is
+        needed even with background writes enabled.
+        """
+        if directory not in self._known_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._known_dirs.add(directory)
+
+    def _serialize(self, pass_data: Dict[str, Any]) -> bytes:
+        """Serialize a document in the configured on-disk format."""
+        if self.format == 'msgpack':
+            return packb(pass_data)
+        return dumps_bytes(pass_data, indent=True)
+
+    def _deserialize(self, payload: bytes) -> Dict[str, Any]:
+        """Parse a document from the configured on-disk format."""
+        if self.format == 'msgpack':
+            return unpackb(payload)
+        return loads(payload)
+
+    @staticmethod
+    def _write_document(pass_path: Path, payload: bytes) -> None:
+        """Atomically write a serialized document to its final path.
+
+        The payload lands in a unique temporary file and is renamed into
+        place, so readers (and crashes) can never observe a partial pass
+        file.
+        """
+        tmp_path = pass_path.with_name(f"{pass_path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, pass_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _writer_loop(self) -> None:
+        """Drain queued writes on the background writer thread."""
+        while True:
+            pass_path, payload, key = self._write_queue.get()
+            try:
+                self._write_document(pass_path, payload)
+            except Exception as e:
+                logger.error("❌ Background write failed for {}: {}", pass_path, e)
+            finally:
+                self._pending.pop(key, None)
+                self._write_queue.task_done()
+
+    def flush(self) -> None:
+        """Block until all queued background writes have hit disk."""
+        if self.async_writes:
+            self._write_queue.join()
+
     def store_pass(self, provider: str, pass_id: str, pass_data: Dict[str, Any]) -> None:
-        """Store pass data in the file system."""
-        # Create provider directory if it doesn't exist
-        provider_dir = self.storage_path / provider / "passes"
-        os.makedirs(provider_dir, exist_ok=True)
-        
-        # Store the pass data
-        pass_path = provider_dir / f"{pass_id}.json"
-        with open(pass_path, 'w') as f:
-            json.dump(pass_data, f, indent=2)
+        """Store pass data in the file system.
+
+        Writes are atomic (temp file + rename). In async_writes mode the
+        serialized document is queued for the background writer and this
+        returns immediately.
+        """
+        # Create the shard directory if it doesn't exist
+        pass_path = self._pass_path(provider, pass_id)
+        self._ensure_dir(pass_path.parent)
+
+        # Serialize on the caller thread (orjson/msgpack emit bytes
+        # directly); only the disk write is deferred in async mode
+        payload = self._serialize(pass_data)
+        key = (provider, pass_id)
+
+        if self.async_writes:
+            self._pending[key] = copy.deepcopy(pass_data)
+            self._write_queue.put((pass_path, payload, key))
+        else:
+            self._write_document(pass_path, payload)
+
+        self._cache_put(key, pass_data)
         
         context = with_context(provider=provider, pass_id=pass_id, path=str(pass_path))
         logger.bind(**context).debug("✅ Stored pass data to filesystem")
     
+    def _cache_put(self, key: tuple, pass_data: Dict[str, Any]) -> None:
+        """Insert a private copy of a document into the read cache."""
+        self._cache[key] = copy.deepcopy(pass_data)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._CACHE_MAX:
+            self._cache.popitem(last=False)
+
     def retrieve_pass(self, provider: str, pass_id: str) -> Dict[str, Any]:
-        """Retrieve pass data from the file system."""
-        pass_path = self.storage_path / provider / "passes" / f"{pass_id}.json"
-        
+        """Retrieve pass data from the file system.
+
+        Hot passes are served from an in-memory LRU of parsed documents,
+        skipping the file read and JSON parse entirely on repeat reads.
+        """
+        key = (provider, pass_id)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            context = with_context(provider=provider, pass_id=pass_id)
+            logger.bind(**context).debug("✅ Retrieved pass data from read cache")
+            return copy.deepcopy(cached)
+
+        if self.async_writes:
+            # A queued write may not have hit disk yet; serve it from the
+            # pending map so writers always see their own writes
+            pending = self._pending.get(key)
+            if pending is not None:
+                return copy.deepcopy(pending)
+
+        pass_path = self._pass_path(provider, pass_id)
+
+        if not pass_path.exists():
+            # Fall back to the flat layout used before sharding
+            pass_path = self._legacy_pass_path(provider, pass_id)
+
         if not pass_path.exists():
             context = with_context(provider=provider, pass_id=pass_id, path=str(pass_path))
             logger.bind(**context).error("❌ Pass file not found")
             raise FileNotFoundError(f"Pass not found: {pass_id}")
         
-        with open(pass_path, 'r') as f:
-            pass_data = json.load(f)
-        
+        pass_data = self._deserialize(pass_path.read_bytes())
+        self._cache_put(key, pass_data)
+
         context = with_context(provider=provider, pass_id=pass_id, path=str(pass_path))
         logger.bind(**context).debug("✅ Retrieved pass data from filesystem")
-        
+
         return pass_data
     
     def delete_pass(self, provider: str, pass_id: str) -> bool:
         """Delete pass data from the file system."""
-        pass_path = self.storage_path / provider / "passes" / f"{pass_id}.json"
+        self._cache.pop((provider, pass_id), None)
+        if self.async_writes:
+            # Don't race a queued write for this pass: let it land, then
+            # unlink the resulting file
+            self.flush()
+        pass_path = self._pass_path(provider, pass_id)
+
+        if not pass_path.exists():
+            # Fall back to the flat layout used before sharding
+            pass_path = self._legacy_pass_path(provider, pass_id)
+
         context = with_context(provider=provider, pass_id=pass_id, path=str(pass_path))
-        
+
         if not pass_path.exists():
             logger.bind(**context).warning("⚠️ Pass not found for deletion")
             return False
@@ -88,25 +304,239 @@ class FileSystemStorage(StorageBackend):
         
         return True
     
+    def retrieve_passes(self, provider: str, pass_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Retrieve several passes, overlapping the file reads.
+
+        Fans the reads out over a short-lived thread pool so each one's
+        disk or network wait overlaps the others — throughput on
+        high-latency filesystems scales with the pool until the device
+        queue saturates. Read-cache hits short-circuit inside
+        retrieve_pass as usual.
+        """
+        pass_ids = list(pass_ids)
+        if len(pass_ids) <= 1:
+            return {pass_id: self.retrieve_pass(provider, pass_id) for pass_id in pass_ids}
+
+        with ThreadPoolExecutor(max_workers=min(32, len(pass_ids))) as executor:
+            return dict(zip(
+                pass_ids,
+                executor.map(lambda pass_id: self.retrieve_pass(provider, pass_id), pass_ids),
+            ))
+
+    def delete_passes(self, provider: str, pass_ids: List[str]) -> Dict[str, bool]:
+        """Delete several passes, overlapping the unlinks."""
+        pass_ids = list(pass_ids)
+        if len(pass_ids) <= 1:
+            return {pass_id: self.delete_pass(provider, pass_id) for pass_id in pass_ids}
+
+        with ThreadPoolExecutor(max_workers=min(32, len(pass_ids))) as executor:
+            return dict(zip(
+                pass_ids,
+                executor.map(lambda pass_id: self.delete_pass(provider, pass_id), pass_ids),
+            ))
+
+    def migrate_flat_layout(self, provider: str) -> int:
+        """Move legacy flat-layout pass files into their shard directories.
+
+        Passes written by pre-sharding versions remain readable without
+        this, but live on the flat-directory slow path; run once per
+        provider to finish the migration.
+
+        Args:
+            provider: Provider whose passes to migrate
+
+        Returns:
+            Number of files moved
+        """
+        provider_dir = self.storage_path / provider / "passes"
+        moved = 0
+        try:
+            with os.scandir(provider_dir) as entries:
+                flat = [
+                    entry.name for entry in entries
+                    if entry.name.endswith(self._suffix) and entry.is_file(follow_symlinks=False)
+                ]
+        except FileNotFoundError:
+            return 0
+
+        for name in flat:
+            pass_id = name[:-len(self._suffix)]
+            pass_path = self._pass_path(provider, pass_id)
+            self._ensure_dir(pass_path.parent)
+            os.replace(provider_dir / name, pass_path)
+            moved += 1
+
+        context = with_context(provider=provider, directory=str(provider_dir))
+        logger.bind(**context).info(f"📦 Migrated {moved} passes to sharded layout")
+
+        return moved
+
     def list_passes(self, provider: str) -> List[str]:
-        """List all pass IDs stored in the file system."""
+        """List all pass IDs stored in the file system.
+
+        Walks the shard directories (and any legacy flat files) with
+        os.scandir, which reads names and entry types straight from the
+        directory stream instead of building and stat-ing a Path per file.
+        """
         provider_dir = self.storage_path / provider / "passes"
         context = with_context(provider=provider, directory=str(provider_dir))
-        
-        if not provider_dir.exists():
+
+        suffix = self._suffix
+        pass_ids = []
+        try:
+            with os.scandir(provider_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        with os.scandir(entry.path) as shard_entries:
+                            pass_ids.extend(
+                                shard_entry.name[:-len(suffix)]
+                                for shard_entry in shard_entries
+                                if shard_entry.name.endswith(suffix)
+                                and shard_entry.is_file(follow_symlinks=False)
+                            )
+                    elif entry.name.endswith(suffix):
+                        # Legacy flat layout
+                        pass_ids.append(entry.name[:-len(suffix)])
+        except FileNotFoundError:
             logger.bind(**context).debug("ℹ️ Provider directory does not exist")
             return []
-        
-        pass_ids = []
-        for file_path in provider_dir.glob("*.json"):
-            pass_id = file_path.stem
-            pass_ids.append(pass_id)
-        
+
         logger.bind(**context).debug(f"📃 Found {len(pass_ids)} passes")
-        
+
         return pass_ids
 
 
+class SQLiteStorage(StorageBackend):
+    """SQLite-backed storage for passes.
+
+    Keeps every pass in one WAL-mode database file instead of one file
+    per pass, which amortizes the open/write/close cost across the
+    process and keeps list/retrieve at index speed regardless of pass
+    count. Suited to bulk and transactional workloads, and to network
+    filesystems where per-file round-trips dominate.
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        """Initialize with database path.
+
+        Args:
+            db_path: Path to the SQLite database file (created if absent)
+        """
+        self.db_path = Path(db_path)
+        os.makedirs(self.db_path.parent, exist_ok=True)
+
+        # autocommit (isolation_level=None) keeps single statements
+        # atomic without leaving transactions open between calls; the
+        # lock serializes access since connections are shared across
+        # threads
+        self._conn = sqlite3.connect(
+            str(self.db_path), isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS passes ("
+                "provider TEXT NOT NULL, "
+                "pass_id TEXT NOT NULL, "
+                "data BLOB NOT NULL, "
+                "PRIMARY KEY (provider, pass_id))"
+            )
+
+    def store_pass(self, provider: str, pass_id: str, pass_data: Dict[str, Any]) -> None:
+        """Store pass data in the database."""
+        payload = dumps_bytes(pass_data)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO passes (provider, pass_id, data) VALUES (?, ?, ?)",
+                (provider, pass_id, payload),
+            )
+
+        context = with_context(provider=provider, pass_id=pass_id, db=str(self.db_path))
+        logger.bind(**context).debug("✅ Stored pass data in SQLite")
+
+    def store_passes_bulk(self, provider: str, items: Dict[str, Dict[str, Any]]) -> None:
+        """Store several passes in one transaction.
+
+        Serializes all documents up front and hands them to executemany,
+        so the batch pays one transaction commit instead of one per pass.
+
+        Args:
+            provider: Provider the passes belong to
+            items: Dict mapping pass ID to its data
+        """
+        rows = [
+            (provider, pass_id, dumps_bytes(pass_data))
+            for pass_id, pass_data in items.items()
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO passes (provider, pass_id, data) VALUES (?, ?, ?)",
+                    rows,
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        context = with_context(provider=provider, db=str(self.db_path))
+        logger.bind(**context).debug(f"✅ Stored {len(rows)} passes in SQLite")
+
+    def retrieve_pass(self, provider: str, pass_id: str) -> Dict[str, Any]:
+        """Retrieve pass data from the database."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM passes WHERE provider = ? AND pass_id = ?",
+                (provider, pass_id),
+            ).fetchone()
+
+        context = with_context(provider=provider, pass_id=pass_id, db=str(self.db_path))
+
+        if row is None:
+            logger.bind(**context).error("❌ Pass not found in SQLite storage")
+            raise KeyError(f"Pass not found: {provider}/{pass_id}")
+
+        logger.bind(**context).debug("✅ Retrieved pass data from SQLite")
+        return loads(row[0])
+
+    def delete_pass(self, provider: str, pass_id: str) -> bool:
+        """Delete pass data from the database."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM passes WHERE provider = ? AND pass_id = ?",
+                (provider, pass_id),
+            )
+
+        context = with_context(provider=provider, pass_id=pass_id, db=str(self.db_path))
+
+        if cursor.rowcount == 0:
+            logger.bind(**context).warning("⚠️ Pass not found for deletion in SQLite")
+            return False
+
+        logger.bind(**context).info("🗑️ Deleted pass from SQLite")
+        return True
+
+    def list_passes(self, provider: str) -> List[str]:
+        """List all pass IDs stored for a provider."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT pass_id FROM passes WHERE provider = ?", (provider,)
+            ).fetchall()
+
+        context = with_context(provider=provider, db=str(self.db_path))
+        logger.bind(**context).debug(f"📃 Found {len(rows)} passes")
+
+        return [row[0] for row in rows]
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
 class MemoryStorage(StorageBackend):
     """In-memory storage for passes. Useful for testing."""
     
@@ -159,26 +589,55 @@ class MemoryStorage(StorageBackend):
         return pass_ids
 
 
+# Backends memoized by (storage_type, sorted kwargs); see
+# create_storage_backend
+_backends: Dict[tuple, StorageBackend] = {}
+
+
 # Factory function to create a storage backend
 def create_storage_backend(storage_type: str, **kwargs) -> StorageBackend:
     """
     Create a storage backend instance.
-    
+
+    Filesystem and SQLite backends are memoized per configuration and
+    shared process-wide: code that calls this factory per request (e.g.
+    inside a web handler) keeps reusing one backend — and its read cache
+    and open database connection — instead of constructing a fresh one
+    each time. Memory backends are always fresh, since sharing one across
+    unrelated callers would leak state between them.
+
     Args:
-        storage_type: Type of storage ('filesystem', 'memory', or custom)
+        storage_type: Type of storage ('filesystem', 'sqlite', 'memory', or custom)
         **kwargs: Additional arguments for the storage backend
-    
+
     Returns:
         A StorageBackend instance
     """
+    if storage_type == 'memory':
+        return MemoryStorage()
+
+    key = (storage_type, tuple(sorted((k, str(v)) for k, v in kwargs.items())))
+    backend = _backends.get(key)
+    if backend is not None:
+        return backend
+
     if storage_type == 'filesystem':
         if 'storage_path' not in kwargs:
             raise ValueError("storage_path is required for filesystem storage")
-        
-        return FileSystemStorage(kwargs['storage_path'])
-    
-    elif storage_type == 'memory':
-        return MemoryStorage()
-    
+
+        # Forward every kwarg: the memo key is built over all of them, so
+        # options like format or async_writes must actually reach the
+        # constructor rather than being silently dropped
+        backend = FileSystemStorage(**kwargs)
+
+    elif storage_type == 'sqlite':
+        if 'db_path' not in kwargs:
+            raise ValueError("db_path is required for sqlite storage")
+
+        backend = SQLiteStorage(**kwargs)
+
     else:
         raise ValueError(f"Unknown storage type: {storage_type}")
+
+    _backends[key] = backend
+    return backend